@@ -10,8 +10,31 @@ Produce:
 """
 import json
 import logging
+import mmap
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
+
+from src.config.settings import RESULT_CACHE_ENABLED, RESULT_CACHE_TTL_SECONDS
+from src.models.email_document import EmailDocument
+from src.models.pipeline_version import PipelineVersion
+from src.postprocessing.pipeline import postprocess_and_enrich
+from src.postprocessing.redis_barrier import build_redis_client
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    ORJSON_AVAILABLE = False
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    SIMDJSON_AVAILABLE = False
 
 # ---------------------------------------------------------------------------
 # Setup logging
@@ -33,16 +56,93 @@ CANDIDATES_FILE = IO_DIR / "pipeline_last_output.json"
 TRIAGE_FILE     = IO_DIR / "triage_result_gemma.json"
 OUTPUT_FILE     = IO_DIR / "postprocessing_result.json"
 
+
+# ---------------------------------------------------------------------------
+# JSON I/O (orjson se disponibile, altrimenti stdlib json)
+# ---------------------------------------------------------------------------
+@contextmanager
+def _mapped(path: Path) -> Iterator[memoryview]:
+    """
+    Mappa il file in memoria: i parser C leggono le pagine senza copia in un bytes.
+
+    Un file vuoto non si può mappare (mmap solleva ValueError): viene letto
+    normalmente, così il parser solleva il consueto JSONDecodeError.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield memoryview(f.read())
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            yield view
+
+
+def _read_json(path: Path) -> dict:
+    """Legge un file JSON come bytes, senza decode UTF-8 a livello Python."""
+    if ORJSON_AVAILABLE:
+        with _mapped(path) as view:
+            return orjson.loads(view)
+    return json.loads(path.read_bytes())
+
+
+def _read_json_fields(path: Path, *fields: str) -> dict:
+    """
+    Legge da un file JSON solo i campi top-level richiesti.
+
+    Con pysimdjson il documento viene parsato in modo lazy: vengono
+    materializzati come oggetti Python solo i sottoalberi di *fields*
+    (es. ``metadata`` o ``messages_sent`` non vengono mai costruiti).
+    Senza pysimdjson ricade su :func:`_read_json` e filtra le chiavi.
+    """
+    if SIMDJSON_AVAILABLE:
+        out: dict = {}
+        with _mapped(path) as view:
+            doc = simdjson.Parser().parse(view)
+            for name in fields:
+                value = doc[name]
+                if isinstance(value, simdjson.Object):
+                    value = value.as_dict()
+                elif isinstance(value, simdjson.Array):
+                    value = value.as_list()
+                out[name] = value
+        return out
+    data = _read_json(path)
+    return {name: data[name] for name in fields}
+
+
+def _loads(data: bytes | str) -> dict:
+    """Decodifica un payload JSON (es. letto da Redis)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: dict) -> bytes:
+    """Serializza *data* in JSON compatto (UTF-8)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Scrive *data* come JSON indentato (2 spazi), UTF-8 senza escape ASCII."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Load inputs
 # ---------------------------------------------------------------------------
 logger.info("Caricamento input...")
 
-with open(CANDIDATES_FILE, encoding="utf-8") as f:
-    pipeline_output: dict = json.load(f)
-
-with open(TRIAGE_FILE, encoding="utf-8") as f:
-    triage_raw: dict = json.load(f)
+# I due file sono indipendenti: lettura + parse in parallelo (read() e i
+# parser C rilasciano il GIL)
+with ThreadPoolExecutor(max_workers=2) as executor:
+    _fut_candidates = executor.submit(_read_json_fields, CANDIDATES_FILE, "message_id", "candidates")
+    _fut_triage = executor.submit(_read_json_fields, TRIAGE_FILE, "model", "triage_response")
+    pipeline_output: dict = _fut_candidates.result()
+    triage_raw: dict = _fut_triage.result()
 
 # ---------------------------------------------------------------------------
 # Estrae i dati necessari
@@ -66,31 +166,30 @@ logger.info("candidates        : %d", len(candidates))
 # non viene trasportato. Viene ricostruito un body_canonical rappresentativo
 # dai quote di evidenza presenti nella triage_response.
 # ---------------------------------------------------------------------------
-from src.models.email_document import EmailDocument
-
-evidence_quotes = []
+# Body sintetico assemblato dai quote di evidenza: un solo passaggio che
+# deduplica (order-preserving) e accoda direttamente i pezzi del body, così
+# l'unico str.join finale alloca la stringa una volta sola.
+seen_quotes: set = set()
+body_parts: list = ["Buongiorno,\n\n"]
 for topic in triage_response.get("topics", []):
     for ev in topic.get("evidence", []):
         q = ev.get("quote", "").strip()
-        if q and q not in evidence_quotes:
-            evidence_quotes.append(q)
-
-# Body sintetico assemblato dai quote di evidenza
-reconstructed_body = (
-    "Buongiorno,\n\n"
-    + " ".join(evidence_quotes)
-    + "\n\nCordiali saluti,\nMario Rossi"
+        if q and q not in seen_quotes:
+            seen_quotes.add(q)
+            if len(body_parts) > 1:
+                body_parts.append(" ")
+            body_parts.append(q)
+body_parts.append("\n\nCordiali saluti,\nMario Rossi")
+reconstructed_body = "".join(body_parts)
+
+# Subject: ricostruito dai term sorgente "subject" nel pipeline output.
+# Prende il termine più lungo come proxy del subject (singolo passaggio, senza lista intermedia)
+subject_proxy = max(
+    (c["term"] for c in candidates if c.get("source") == "subject"),
+    key=len,
+    default="Richiesta informazioni contratto",
 )
 
-# Subject: ricostruito dai term sorgente "subject" nel pipeline output
-subject_terms = [
-    c["term"]
-    for c in candidates
-    if c.get("source") == "subject"
-]
-# Prende il termine più lungo come proxy del subject
-subject_proxy = max(subject_terms, key=len) if subject_terms else "Richiesta informazioni contratto"
-
 document = EmailDocument(
     message_id=message_id,
     from_raw="Mario Rossi <mario.rossi@example.it>",
@@ -105,8 +204,6 @@ logger.info("body_canonical    : %d chars", len(document.body_canonical))
 # ---------------------------------------------------------------------------
 # PipelineVersion
 # ---------------------------------------------------------------------------
-from src.models.pipeline_version import PipelineVersion
-
 pipeline_version = PipelineVersion(
     dictionaryversion=dict_version,
     modelversion=model_name,
@@ -120,16 +217,37 @@ pipeline_version = PipelineVersion(
 # ---------------------------------------------------------------------------
 # Esecuzione pipeline
 # ---------------------------------------------------------------------------
-from src.postprocessing.pipeline import postprocess_and_enrich
-
-logger.info("Avvio pipeline post-processing...")
-
-result = postprocess_and_enrich(
-    llm_output_raw=triage_response,       # già un dict con triage_response
-    candidates=candidates,
-    document=document,
-    pipeline_version=pipeline_version,
-)
+# Cache dei risultati: la pipeline è deterministica dato
+# (message_id, dictionaryversion, model), quindi un rerun può riusare l'output.
+cache_key = f"pp:{message_id}:{dict_version}:{model_name}"
+cache_client = None
+cached = None
+if RESULT_CACHE_ENABLED:
+    try:
+        cache_client = build_redis_client()
+        cached = cache_client.get(cache_key)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Cache Redis non disponibile, esecuzione completa: %s", exc)
+        cache_client = None
+
+if cached:
+    logger.info("Cache hit: %s — pipeline saltata", cache_key)
+    result = _loads(cached)
+else:
+    logger.info("Avvio pipeline post-processing...")
+
+    result = postprocess_and_enrich(
+        llm_output_raw=triage_response,       # già un dict con triage_response
+        candidates=candidates,
+        document=document,
+        pipeline_version=pipeline_version,
+    )
+
+    if cache_client is not None:
+        try:
+            cache_client.set(cache_key, _dumps(result), ex=RESULT_CACHE_TTL_SECONDS)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Impossibile salvare il risultato in cache: %s", exc)
 
 logger.info("Pipeline completata in %d ms", result["processing_metadata"]["postprocessing_duration_ms"])
 logger.info("Entità estratte   : %d", result["processing_metadata"]["entities_extracted"])
@@ -138,40 +256,40 @@ logger.info("Osservazioni      : %d", result["processing_metadata"]["observation
 # ---------------------------------------------------------------------------
 # Salvataggio output
 # ---------------------------------------------------------------------------
-with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-    json.dump(result, f, ensure_ascii=False, indent=2)
+_write_json(OUTPUT_FILE, result)
 
 logger.info("Output salvato in: %s", OUTPUT_FILE)
 
 # ---------------------------------------------------------------------------
-# Stampa riepilogo a video
+# Stampa riepilogo a video (disattivabile con POSTPROC_VERBOSE=0 nei run batch/CI)
 # ---------------------------------------------------------------------------
-print("\n" + "=" * 70)
-print("POST-PROCESSING RESULT — RIEPILOGO")
-print("=" * 70)
-print(f"message_id  : {result['message_id']}")
-print(f"model       : {result['pipeline_version']['modelversion']}")
-
-triage = result["triage"]
-print(f"\nSentiment   : {triage['sentiment']['value']} (conf={triage['sentiment']['confidence']:.2f})")
-print(f"Priority    : {triage['priority']['value']} (conf={triage['priority']['confidence']:.2f})")
-print(f"Customer    : {triage['customerstatus']['value']} (conf={triage['customerstatus']['confidence']:.2f})")
-
-print(f"\nTopics ({len(triage['topics'])}):")
-for t in triage["topics"]:
-    kw_count = len(t.get("keywordsintext", []))
-    ev_count = len(t.get("evidence", []))
-    print(f"  [{t['labelid']:20s}] conf={t['confidence']:.2f}  kw={kw_count}  evidence={ev_count}")
-
-if result["entities"]:
-    print(f"\nEntità estratte ({len(result['entities'])}):")
-    for e in result["entities"]:
-        print(f"  {e['label']:16s} → {e['text']}")
-
-diag = result["diagnostics"]
-if diag.get("warnings"):
-    print(f"\nWarning: {diag['warnings']}")
-
-print("=" * 70)
-print(f"Output: {OUTPUT_FILE}")
-print("=" * 70 + "\n")
+if os.getenv("POSTPROC_VERBOSE", "1") == "1":
+    print("\n" + "=" * 70)
+    print("POST-PROCESSING RESULT — RIEPILOGO")
+    print("=" * 70)
+    print(f"message_id  : {result['message_id']}")
+    print(f"model       : {result['pipeline_version']['modelversion']}")
+
+    triage = result["triage"]
+    print(f"\nSentiment   : {triage['sentiment']['value']} (conf={triage['sentiment']['confidence']:.2f})")
+    print(f"Priority    : {triage['priority']['value']} (conf={triage['priority']['confidence']:.2f})")
+    print(f"Customer    : {triage['customerstatus']['value']} (conf={triage['customerstatus']['confidence']:.2f})")
+
+    print(f"\nTopics ({len(triage['topics'])}):")
+    for t in triage["topics"]:
+        kw_count = len(t.get("keywordsintext", []))
+        ev_count = len(t.get("evidence", []))
+        print(f"  [{t['labelid']:20s}] conf={t['confidence']:.2f}  kw={kw_count}  evidence={ev_count}")
+
+    if result["entities"]:
+        print(f"\nEntità estratte ({len(result['entities'])}):")
+        for e in result["entities"]:
+            print(f"  {e['label']:16s} → {e['text']}")
+
+    diag = result["diagnostics"]
+    if diag.get("warnings"):
+        print(f"\nWarning: {diag['warnings']}")
+
+    print("=" * 70)
+    print(f"Output: {OUTPUT_FILE}")
+    print("=" * 70 + "\n")
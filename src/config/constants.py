@@ -2,7 +2,8 @@
 Constants used across the pipeline.
 Versioned and pinned for determinism.
 """
-from typing import List, Set
+import re
+from typing import FrozenSet, List, Pattern
 
 # =============================================================================
 # Topic Taxonomy (closed enum)
@@ -37,7 +38,9 @@ HIGH_TERMS: List[str] = [
 # =============================================================================
 STOPLIST_VERSION: str = "stopwords-it-2025.2"
 
-STOPWORDS_IT: Set[str] = {
+# Token-level filtering: use the frozenset (`token in STOPWORDS_IT`).
+# Raw-text scanning: use STOPWORDS_RE (single compiled alternation).
+STOPWORDS_IT: FrozenSet[str] = frozenset({
     "grazie", "cordiali", "saluti", "buongiorno", "buonasera",
     "ciao", "distinti", "gentile", "egregio", "spett",
     "il", "lo", "la", "le", "li", "gli", "un", "uno", "una",
@@ -57,7 +60,14 @@ STOPWORDS_IT: Set[str] = {
     "molto", "poco", "bene", "male", "sempre", "mai",
     "dove", "quando", "perché", "cosa", "tutto", "ogni",
     "re", "fw", "fwd",
-}
+})
+
+STOPWORDS_RE: Pattern[str] = re.compile(
+    r"\b(?:"
+    + "|".join(map(re.escape, sorted(STOPWORDS_IT, key=lambda w: (-len(w), w))))
+    + r")\b",
+    re.IGNORECASE,
+)
 
 # =============================================================================
 # Blacklist patterns (regex) for candidate filtering
@@ -69,6 +79,17 @@ BLACKLIST_PATTERNS: List[str] = [
     r"^[a-z]$",        # single characters
 ]
 
+# Compiled once per process. Callers filter a term with a single
+# `BLACKLIST_UNION.search(term)`; the per-pattern list is kept for diagnostics.
+# Both are case-insensitive on purpose, so "RE:", "FWD:" and single uppercase
+# letters are blacklisted like their lowercase forms.
+BLACKLIST_COMPILED: List[Pattern[str]] = [re.compile(p, re.IGNORECASE) for p in BLACKLIST_PATTERNS]
+
+BLACKLIST_UNION: Pattern[str] = re.compile(
+    "|".join(f"(?:{p})" for p in BLACKLIST_PATTERNS),
+    re.IGNORECASE,
+)
+
 # =============================================================================
 # Customer status text signals (Italian)
 # =============================================================================
@@ -2,6 +2,7 @@
 Environment settings loaded from .env file.
 """
 import os
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -20,6 +21,8 @@ CRM_API_TIMEOUT_MS: int = int(os.getenv("CRM_API_TIMEOUT_MS", "500"))
 
 # --- Redis ---
 REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+RESULT_CACHE_ENABLED: bool = os.getenv("RESULT_CACHE_ENABLED", "false").lower() == "true"
+RESULT_CACHE_TTL_SECONDS: int = int(os.getenv("RESULT_CACHE_TTL_SECONDS", "3600"))
 
 # --- NLP Models ---
 SPACY_MODEL: str = os.getenv("SPACY_MODEL", "it_core_news_lg")
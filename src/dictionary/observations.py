@@ -6,6 +6,7 @@ that feed the batch Promoter job for dictionary auto-update.
 
 Reference: post-processing-enrichment-layer.md §9
 """
+import os
 import uuid
 from datetime import datetime, timezone
 from typing import List
@@ -33,7 +34,14 @@ def build_observations(
         List of observation dicts ready for DB insert.
     """
     observations: List[dict] = []
-    candidate_map = {c["candidateid"]: c for c in candidates}
+    # Index only the candidates actually referenced by the topics
+    needed = {kw["candidateid"] for t in topics for kw in t.get("keywordsintext", [])}
+    candidate_map = {c["candidateid"]: c for c in candidates if c["candidateid"] in needed}
+    # All observations of a single message share the same timestamp
+    observed_at = datetime.now(timezone.utc).isoformat()
+    # One urandom read for every obs_id (upper bound: one per keyword)
+    n_keywords = sum(len(t.get("keywordsintext", [])) for t in topics)
+    random_block = os.urandom(16 * n_keywords)
 
     for topic in topics:
         labelid = topic["labelid"]
@@ -43,8 +51,10 @@ def build_observations(
             cand = candidate_map.get(cid)
 
             if cand:
+                offset = 16 * len(observations)
+                obs_id = uuid.UUID(bytes=random_block[offset : offset + 16], version=4)
                 obs = {
-                    "obs_id": str(uuid.uuid4()),
+                    "obs_id": str(obs_id),
                     "message_id": message_id,
                     "labelid": labelid,
                     "candidateid": cid,
@@ -54,7 +64,7 @@ def build_observations(
                     "embeddingscore": cand.get("embeddingscore", 0.0),
                     "dict_version": dict_version,
                     "promoted_to_active": False,
-                    "observed_at": datetime.now(timezone.utc).isoformat(),
+                    "observed_at": observed_at,
                 }
                 observations.append(obs)
 
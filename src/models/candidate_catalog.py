@@ -0,0 +1,65 @@
+"""
+CandidateCatalog — candidate list with a lazily built candidateid index.
+
+The same catalog instance can be reused across pipeline stages, LLM retries
+and repeated runs on the same candidate list: the index is built once.
+"""
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Iterator, List, Union
+
+
+@dataclass
+class CandidateCatalog:
+    """Candidate keywords from the Candidate Generation Layer."""
+
+    candidates: List[dict]
+
+    @cached_property
+    def by_id(self) -> Dict[str, dict]:
+        """
+        {candidateid: candidate}, built on first access.
+
+        Keys are interned: lookups with an interned candidateid (see
+        resolve_keywords_from_catalog) compare by identity.
+        """
+        return {sys.intern(c["candidateid"]): c for c in self.candidates}
+
+    @cached_property
+    def by_id_fields(self) -> Dict[str, dict]:
+        """
+        {candidateid: resolved keyword fields}, built on first access.
+
+        Holds only the catalog fields copied onto each resolved keyword
+        (lemma, term, count, source, embeddingscore), ready for dict.update().
+        """
+        return {
+            cid: {
+                "lemma": c["lemma"],
+                "term": c["term"],
+                "count": c["count"],
+                "source": c["source"],
+                "embeddingscore": c.get("embeddingscore", 0.0),
+            }
+            for cid, c in self.by_id.items()
+        }
+
+    @classmethod
+    def of(cls, candidates: CandidatesLike) -> CandidateCatalog:
+        """Wrap a plain candidate list; an existing catalog is returned as-is."""
+        if isinstance(candidates, CandidateCatalog):
+            return candidates
+        return cls(candidates)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.candidates)
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+
+# Accepted wherever a candidate list is expected
+CandidatesLike = Union[List[dict], CandidateCatalog]
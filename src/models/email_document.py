@@ -1,11 +1,13 @@
 """
 EmailDocument and RemovedSection — canonical email representation.
 """
+import hashlib
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class RemovedSection:
     """Tracks what was removed during canonicalization (for audit)."""
 
@@ -27,11 +29,26 @@ class EmailDocument:
     removed_sections: tuple = field(default=())         # Tuple[RemovedSection, ...]
     parser_version: str = "email-parser-1.3.0"
     canonicalization_version: str = "1.2.0"
+    _from_email: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen → from_raw never changes: parse the bare address once.
+        raw = self.from_raw
+        _, lt, rest = raw.partition("<")
+        address, gt, _ = rest.partition(">")
+        object.__setattr__(self, "_from_email", address.strip() if lt and gt else raw.strip())
 
     @property
     def from_email(self) -> str:
-        """Extract bare email address from from_raw."""
-        raw = self.from_raw
-        if "<" in raw and ">" in raw:
-            return raw[raw.index("<") + 1 : raw.index(">")].strip()
-        return raw.strip()
+        """Bare email address extracted from from_raw."""
+        return self._from_email
+
+    @cached_property
+    def body_canonical_lower(self) -> str:
+        """Lowercased body_canonical, computed on first access and shared by all consumers."""
+        return self.body_canonical.lower()
+
+    @cached_property
+    def body_canonical_sha256(self) -> str:
+        """SHA-256 hex digest of body_canonical (evidence text_hash), computed once."""
+        return hashlib.sha256(self.body_canonical.encode()).hexdigest()
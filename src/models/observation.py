@@ -4,7 +4,7 @@ KeywordObservation — structured observation for dictionary promoter.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordObservation:
     """A single keyword observation for batch promoter processing."""
 
@@ -13,3 +13,6 @@ class ValidationResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     data: Optional[dict] = None
+    # Evidence warnings of the topics kept in ``data`` (after deduplication),
+    # reusable by enforce_evidence_policy() without re-verifying the quotes.
+    evidence_warnings: List[str] = field(default_factory=list)
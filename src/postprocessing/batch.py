@@ -0,0 +1,140 @@
+"""
+Batch Post-Processing — process-pool fan-out of postprocess_and_enrich().
+
+Every email is processed independently (pure function of its LLM output,
+candidates and document), so a queue drain parallelizes at email
+granularity. Arguments shared by the whole batch (pipeline version, CRM
+lookup, scorer, collision index) are bound once per worker process by the
+pool initializer instead of being pickled with every task.
+
+Usage
+-----
+    from src.postprocessing.batch import BatchItem, postprocess_and_enrich_batch
+
+    items = [BatchItem(llm_output, candidates, document), ...]
+    for res in postprocess_and_enrich_batch(items, pipeline_version):
+        if res.error is None:
+            store(res.result)
+"""
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.models.email_document import EmailDocument
+from src.models.pipeline_version import PipelineVersion
+from src.postprocessing.pipeline import postprocess_and_enrich
+from src.postprocessing.priority_scorer import PriorityScorer
+
+logger = logging.getLogger(__name__)
+
+
+class BatchItem(NamedTuple):
+    """Per-email inputs of postprocess_and_enrich()."""
+
+    llm_output_raw: dict | str
+    candidates: List[dict]
+    document: EmailDocument
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one email: either result or error is set."""
+
+    index: int                      # position of the item in the input batch
+    message_id: str
+    result: Optional[dict]
+    error: Optional[str]
+
+
+# Per-process arguments shared by every task (set by _init_worker)
+_WORKER_KWARGS: dict = {}
+
+
+def _init_worker(shared_kwargs: dict) -> None:
+    """Pool initializer: bind the batch-wide arguments once per process."""
+    _WORKER_KWARGS.clear()
+    _WORKER_KWARGS.update(shared_kwargs)
+
+
+def _run_item(index: int, item: BatchItem, shared_kwargs: Optional[dict] = None) -> BatchResult:
+    """
+    Process one email; failures are returned, not raised.
+
+    *shared_kwargs* defaults to the arguments bound by _init_worker.
+    """
+    try:
+        result = postprocess_and_enrich(
+            llm_output_raw=item.llm_output_raw,
+            candidates=item.candidates,
+            document=item.document,
+            **(_WORKER_KWARGS if shared_kwargs is None else shared_kwargs),
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Post-processing failed for %s", item.document.message_id)
+        return BatchResult(index, item.document.message_id, None, f"{type(exc).__name__}: {exc}")
+    return BatchResult(index, item.document.message_id, result, None)
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    """forkserver where available (no inherited locks/threads), else spawn."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def postprocess_and_enrich_batch(
+    items: Iterable[BatchItem],
+    pipeline_version: PipelineVersion,
+    workers: Optional[int] = None,
+    crm_lookup: Optional[Callable[[str], Tuple[str, float]]] = None,
+    scorer: Optional[PriorityScorer] = None,
+    collision_index: Optional[dict] = None,
+    evidence_threshold: float = 0.3,
+) -> Iterator[BatchResult]:
+    """
+    Run postprocess_and_enrich() over a batch of emails in a process pool.
+
+    Results are yielded as soon as each email completes (completion order,
+    not input order — use BatchResult.index to reorder). An email that raises
+    (e.g. its LLM output fails validation) yields a BatchResult with
+    ``error`` set instead of aborting the batch.
+
+    Args:
+        items: Per-email inputs.
+        pipeline_version: PipelineVersion shared by the batch.
+        workers: Worker processes. Defaults to os.cpu_count(); 1 runs in-process.
+        crm_lookup: CRM lookup function (must be picklable, e.g. module-level).
+        scorer: PriorityScorer instance. Defaults to module-level scorer.
+        collision_index: Pre-computed collision index shared by the batch.
+        evidence_threshold: Max acceptable evidence failure rate (default 0.3).
+
+    Yields:
+        One BatchResult per item.
+    """
+    shared = {
+        "pipeline_version": pipeline_version,
+        "crm_lookup": crm_lookup,
+        "scorer": scorer,
+        "collision_index": collision_index,
+        "evidence_threshold": evidence_threshold,
+    }
+    items = list(items)
+    if not items:
+        return
+
+    n_workers = min(workers or os.cpu_count() or 1, len(items))
+    if n_workers == 1:
+        for index, item in enumerate(items):
+            yield _run_item(index, item, shared)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=_mp_context(),
+        initializer=_init_worker,
+        initargs=(shared,),
+    ) as executor:
+        futures = [executor.submit(_run_item, index, item) for index, item in enumerate(items)]
+        for future in as_completed(futures):
+            yield future.result()
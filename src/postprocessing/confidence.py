@@ -19,10 +19,19 @@ import logging
 from collections import defaultdict
 from typing import Dict, List, Set
 
-import numpy as np
+from src.models.candidate_catalog import CandidateCatalog, CandidatesLike
 
 logger = logging.getLogger(__name__)
 
+# Composite formula weights
+W_LLM: float = 0.3
+W_KEYWORD_QUALITY: float = 0.4
+W_EVIDENCE: float = 0.2
+W_COLLISION: float = 0.1
+
+# Confidence assigned to a topic without keywords
+NO_KEYWORDS_CONFIDENCE: float = 0.1
+
 
 def compute_topic_confidence_adjusted(
     topic: dict,
@@ -39,6 +48,9 @@ def compute_topic_confidence_adjusted(
         3. Evidence coverage — min(len(evidence) / 2.0, 1.0) (weight 0.2)
         4. Collision penalty — 1/num_labels per ambiguous keyword (weight 0.1)
 
+    Convenience wrapper around compute_topic_confidence_from_map(); callers
+    scoring several topics should build the candidate map once instead.
+
     Args:
         topic: Single topic dict with keywordsintext and evidence.
         candidates: Full candidate list.
@@ -48,72 +60,90 @@ def compute_topic_confidence_adjusted(
     Returns:
         Adjusted confidence in [0.0, 1.0].
     """
-    keywordsintext = topic.get("keywordsintext", [])
-    if not keywordsintext:
-        return 0.1  # Very low confidence if no keywords
-
     cand_map = {c["candidateid"]: c for c in candidates}
+    return compute_topic_confidence_from_map(topic, cand_map, collision_index, llm_confidence)
 
-    # 1. Keyword quality score
-    keyword_scores: List[float] = []
-    for kw in keywordsintext:
-        cand = cand_map.get(kw["candidateid"])
-        if cand:
-            kw_score = cand.get("score", cand.get("embeddingscore", 0.5))
-            keyword_scores.append(kw_score)
-    avg_kw_score = float(np.mean(keyword_scores)) if keyword_scores else 0.0
 
-    # 2. Evidence coverage
-    evidence = topic.get("evidence", [])
-    evidence_score = min(len(evidence) / 2.0, 1.0)
+def compute_topic_confidence_from_map(
+    topic: dict,
+    cand_map: Dict[str, dict],
+    collision_index: Dict[str, Set[str]],
+    llm_confidence: float,
+) -> float:
+    """
+    Same as compute_topic_confidence_adjusted(), with a prebuilt
+    {candidateid: candidate} map.
+    """
+    keywordsintext = topic.get("keywordsintext", [])
+    if not keywordsintext:
+        return NO_KEYWORDS_CONFIDENCE  # Very low confidence if no keywords
 
-    # 3. Collision penalty
+    # 1. Keyword quality score + 3. Collision penalty (one catalog lookup per keyword)
     labelid = topic["labelid"]
+    keyword_scores: List[float] = []
     collision_penalties: List[float] = []
     for kw in keywordsintext:
         cand = cand_map.get(kw["candidateid"])
         if cand:
-            lemma = cand["lemma"]
-            labels_with_lemma = collision_index.get(lemma, {labelid})
+            keyword_scores.append(cand.get("score", cand.get("embeddingscore", 0.5)))
+
+            labels_with_lemma = collision_index.get(cand["lemma"], {labelid})
             if len(labels_with_lemma) > 1:
-                penalty = 1.0 / len(labels_with_lemma)
-                collision_penalties.append(penalty)
+                collision_penalties.append(1.0 / len(labels_with_lemma))
             else:
                 collision_penalties.append(1.0)
 
-    avg_collision_penalty = float(np.mean(collision_penalties)) if collision_penalties else 1.0
+    avg_kw_score = sum(keyword_scores) / len(keyword_scores) if keyword_scores else 0.0
+    avg_collision_penalty = (
+        sum(collision_penalties) / len(collision_penalties) if collision_penalties else 1.0
+    )
+
+    # 2. Evidence coverage
+    evidence = topic.get("evidence", [])
+    evidence_score = min(len(evidence) / 2.0, 1.0)
 
     # Composite formula
     confidence_adjusted = (
-        0.3 * llm_confidence
-        + 0.4 * avg_kw_score
-        + 0.2 * evidence_score
-        + 0.1 * avg_collision_penalty
+        W_LLM * llm_confidence
+        + W_KEYWORD_QUALITY * avg_kw_score
+        + W_EVIDENCE * evidence_score
+        + W_COLLISION * avg_collision_penalty
     )
 
-    return float(np.clip(confidence_adjusted, 0.0, 1.0))
+    # Scalar clamp: np.clip on a Python float costs more than the formula
+    return float(min(max(confidence_adjusted, 0.0), 1.0))
 
 
 def adjust_all_topic_confidences(
     output: dict,
-    candidates: List[dict],
+    candidates: CandidatesLike,
     collision_index: Dict[str, Set[str]],
 ) -> dict:
     """
     ★FIX #2★ Recalculate confidence for all topics with correct naming.
 
+    Every topic is scored by compute_topic_confidence_from_map(), the single
+    implementation of the formula, against one shared candidate map.
+
     Sets:
         topic["confidence_llm"]       = original LLM confidence (read-only)
         topic["confidence_adjusted"]  = recalibrated confidence (production)
         topic["confidence"]           = alias = confidence_adjusted (backward compat)
+
+    *candidates* may be a CandidateCatalog, whose index is then shared
+    with the other stages of the run.
     """
-    for topic in output.get("topics", []):
+    topics = output.get("topics", [])
+    if not topics:
+        return output
+
+    cand_map = CandidateCatalog.of(candidates).by_id
+
+    for topic in topics:
         # Read the starting confidence
         llm_conf = topic.get("confidence_llm", topic.get("confidence", 0.0))
-
-        # Calculate recalibrated confidence
-        adjusted_conf = compute_topic_confidence_adjusted(
-            topic, candidates, collision_index, llm_conf
+        adjusted_conf = compute_topic_confidence_from_map(
+            topic, cand_map, collision_index, llm_conf
         )
 
         # ★FIX #2★ Update fields with consistent naming
@@ -124,7 +154,7 @@ def adjust_all_topic_confidences(
     return output
 
 
-def build_collision_index(candidates: List[dict]) -> Dict[str, Set[str]]:
+def build_collision_index(candidates: CandidatesLike) -> Dict[str, Set[str]]:
     """
     Build collision index: for each lemma, find all labelids where it appears.
 
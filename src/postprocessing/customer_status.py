@@ -11,12 +11,17 @@ NOT delegated to LLM. Uses:
 Reference: post-processing-enrichment-layer.md §5
 """
 import logging
+import re
 from typing import Callable, Tuple
 
 from src.config.constants import EXISTING_CUSTOMER_SIGNALS
 
 logger = logging.getLogger(__name__)
 
+# One precompiled case-insensitive alternation over the signals, run on the
+# original body (no lowercased copy of the text is allocated).
+_SIGNAL_RE = re.compile("|".join(map(re.escape, EXISTING_CUSTOMER_SIGNALS)), re.IGNORECASE)
+
 
 def compute_customer_status(
     from_email: str,
@@ -66,8 +71,7 @@ def compute_customer_status(
 
     # 2. Text Signal Detection (only if CRM had no match)
     if match_type == "none":
-        text_lower = text_body.lower()
-        has_signal = any(sig in text_lower for sig in EXISTING_CUSTOMER_SIGNALS)
+        has_signal = _SIGNAL_RE.search(text_body) is not None
 
         if has_signal:
             return {
@@ -11,14 +11,17 @@ or mixes lemma/term/count values.
 Reference: post-processing-enrichment-layer.md §3.2
 """
 import logging
-from typing import List
+import sys
+from typing import List, Tuple
+
+from src.models.candidate_catalog import CandidateCatalog, CandidatesLike
 
 logger = logging.getLogger(__name__)
 
 
 def resolve_keywords_from_catalog(
     triage_data: dict,
-    candidates: List[dict],
+    candidates: CandidatesLike,
 ) -> dict:
     """
     ★FIX #1★ Resolve all keyword fields using ONLY the candidate catalog.
@@ -28,7 +31,7 @@ def resolve_keywords_from_catalog(
 
     Args:
         triage_data: Validated triage output (topics with keywordsintext).
-        candidates: Full candidate list with all metadata.
+        candidates: Full candidate list with all metadata (list or CandidateCatalog).
 
     Returns:
         triage_data with keyword fields populated from catalog.
@@ -36,41 +39,36 @@ def resolve_keywords_from_catalog(
     Raises:
         ValueError: If a candidateid does not exist in the catalog (critical error).
     """
-    candidate_map = {c["candidateid"]: c for c in candidates}
+    catalog = CandidateCatalog.of(candidates)
+    candidate_fields = catalog.by_id_fields
+    count_mismatches: List[Tuple[str, int, int]] = []
 
     for topic in triage_data.get("topics", []):
-        resolved_keywords: list = []
+        # Keywords are resolved in place: each kw dict is updated with the
+        # catalog fields, no new dicts or lists are allocated
         for kw in topic.get("keywordsintext", []):
-            cid = kw["candidateid"]
+            # Interned: the catalog index and the resolved keyword share one string
+            cid = kw["candidateid"] = sys.intern(kw["candidateid"])
 
-            if cid not in candidate_map:
+            fields = candidate_fields.get(cid)
+            if fields is None:
                 raise ValueError(
                     f"Invented candidateid in keyword resolution: {cid}"
                 )
 
-            # Populate all fields from catalog (trusted source)
-            cand = candidate_map[cid]
-            resolved_kw = {
-                "candidateid": cid,
-                "lemma": cand["lemma"],
-                "term": cand["term"],
-                "count": cand["count"],
-                "source": cand["source"],
-                "embeddingscore": cand.get("embeddingscore", 0.0),
-            }
-
-            # ★FIX #6★ Auto-repair count mismatch: log warning if LLM had a different count
+            # ★FIX #6★ Auto-repair count mismatch: collected, logged once below
             llm_count = kw.get("count")
-            if llm_count is not None and llm_count != cand["count"]:
-                logger.warning(
-                    "Count mismatch for %s: LLM=%d, catalog=%d — using catalog value",
-                    cid,
-                    llm_count,
-                    cand["count"],
-                )
+            if llm_count is not None and llm_count != fields["count"]:
+                count_mismatches.append((cid, llm_count, fields["count"]))
 
-            resolved_keywords.append(resolved_kw)
-
-        topic["keywordsintext"] = resolved_keywords
+            # Populate all fields from catalog (trusted source)
+            kw.update(fields)
+
+    if count_mismatches and logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Count mismatch for %d keyword(s) (candidateid, LLM, catalog): %s — using catalog values",
+            len(count_mismatches),
+            count_mismatches[:10],
+        )
 
     return triage_data
@@ -32,7 +32,7 @@ from __future__ import annotations
 
 import logging
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Dict, Generator, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ logger = logging.getLogger(__name__)
 # Try to import prometheus_client — fail gracefully if missing
 # ---------------------------------------------------------------------------
 try:
-    from prometheus_client import Counter, Histogram, Gauge
+    from prometheus_client import Counter, Gauge, Histogram
     METRICS_AVAILABLE = True
 except ImportError:  # pragma: no cover
     METRICS_AVAILABLE = False
@@ -93,7 +93,7 @@ if METRICS_AVAILABLE:
 else:
     # Stub objects so callers don't need to guard every usage.
     class _NoOpMetric:
-        def labels(self, **_kwargs):  # noqa: ANN001
+        def labels(self, *_args, **_kwargs):  # noqa: ANN002, ANN003
             return self
 
         def inc(self, _amount: float = 1) -> None:
@@ -125,24 +125,43 @@ else:
 # Convenience helpers
 # ---------------------------------------------------------------------------
 
+# Labelled children, memoized per (metric, label values): prometheus_client
+# validates and hashes the label values under a lock on every .labels() call.
+_CHILDREN: Dict[Tuple[int, Tuple[str, ...]], Any] = {}
+
+
+def _child(metric: Any, *labelvalues: str) -> Any:
+    """Return ``metric.labels(*labelvalues)``, creating it only once."""
+    key = (id(metric), labelvalues)
+    child = _CHILDREN.get(key)
+    if child is None:
+        child = _CHILDREN[key] = metric.labels(*labelvalues)
+    return child
+
+
 def record_validation_error(layer_name: str, error_type: str = "generic") -> None:
     """Increment the validation error counter for *layer_name*."""
-    VALIDATION_ERRORS.labels(layer_name=layer_name, error_type=error_type).inc()
+    _child(VALIDATION_ERRORS, layer_name, error_type).inc()
 
 
 def record_span_status(status: str) -> None:
     """Increment the span status counter for *status*."""
-    SPAN_STATUS.labels(status=status).inc()
+    _child(SPAN_STATUS, status).inc()
 
 
 def record_barrier_block(layer_name: str) -> None:
     """Increment the write-barrier block counter for *layer_name*."""
-    BARRIER_BLOCKS.labels(layer_name=layer_name).inc()
+    _child(BARRIER_BLOCKS, layer_name).inc()
 
 
 def update_redis_key_count(layer_name: str, count: int) -> None:
     """Set the Redis key count gauge for *layer_name*."""
-    REDIS_KEYS.labels(layer_name=layer_name).set(count)
+    _child(REDIS_KEYS, layer_name).set(count)
+
+
+def observe_layer_latency(layer_name: str, seconds: float) -> None:
+    """Record one processing latency sample for *layer_name*."""
+    _child(LAYER_LATENCY, layer_name).observe(seconds)
 
 
 @contextmanager
@@ -155,5 +174,5 @@ def timed_layer(layer_name: str) -> Generator[None, None, None]:
         with timed_layer("postprocessing"):
             result = postprocess_and_enrich(...)
     """
-    with LAYER_LATENCY.labels(layer_name=layer_name).time():
+    with _child(LAYER_LATENCY, layer_name).time():
         yield
@@ -9,6 +9,21 @@ Reference: post-processing-enrichment-layer.md §10.7
 from typing import List
 
 
+def _schema_keywords(kws_in: List[dict]) -> List[dict]:
+    """Project keywords onto the six POST_PROCESSING_OUTPUT_SCHEMA fields."""
+    return [
+        {
+            "candidateid": kw["candidateid"],
+            "term": kw["term"],
+            "lemma": kw["lemma"],
+            "count": kw["count"],
+            "source": kw["source"],
+            "embeddingscore": kw.get("embeddingscore", 0.0),
+        }
+        for kw in kws_in
+    ]
+
+
 def normalize_topics_keywords(topics: List[dict]) -> List[dict]:
     """
     ★FIX #4★ Convert internal 'keywordsintext' field to 'keywords'
@@ -17,19 +32,7 @@ def normalize_topics_keywords(topics: List[dict]) -> List[dict]:
     Each keyword gets: candidateid, term, lemma, count, source, embeddingscore.
     """
     for topic in topics:
-        kws_in = topic.get("keywordsintext", [])
-
-        topic["keywords"] = [
-            {
-                "candidateid": kw["candidateid"],
-                "term": kw["term"],
-                "lemma": kw["lemma"],
-                "count": kw["count"],
-                "source": kw["source"],
-                "embeddingscore": kw.get("embeddingscore", 0.0),
-            }
-            for kw in kws_in
-        ]
+        topic["keywords"] = _schema_keywords(topic.get("keywordsintext", []))
 
     return topics
 
@@ -53,14 +56,17 @@ def build_triage_output_schema(
     """
     topics = triage_with_conf.get("topics", [])
 
-    # 1. Map keywordsintext → keywords ★FIX #4★
-    topics = normalize_topics_keywords(topics)
-
-    # 2. Ensure confidence fields are present and consistent
+    # Single pass over the topics:
+    # 1. Map keywordsintext → keywords ★FIX #4★ (same as normalize_topics_keywords)
+    # 2. Ensure confidence fields are present and consistent.
+    #    adjust_all_topic_confidences() already writes both in the pipeline,
+    #    so this only fills them in for triage data built elsewhere.
     for t in topics:
-        base_conf = t.get("confidence", 0.0)
-        t.setdefault("confidence_llm", base_conf)
-        t.setdefault("confidence_adjusted", base_conf)
+        t["keywords"] = _schema_keywords(t.get("keywordsintext", []))
+        if "confidence_llm" not in t:
+            t["confidence_llm"] = t.get("confidence", 0.0)
+        if "confidence_adjusted" not in t:
+            t["confidence_adjusted"] = t.get("confidence", 0.0)
 
     triage_output = {
         "topics": topics,
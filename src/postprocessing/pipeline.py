@@ -15,10 +15,10 @@ Reference: post-processing-enrichment-layer.md §2.2
 """
 import logging
 import time
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 from src.dictionary.observations import build_observations
-from src.postprocessing.metrics import LAYER_LATENCY, record_span_status
+from src.models.candidate_catalog import CandidateCatalog, CandidatesLike
 from src.models.email_document import EmailDocument
 from src.models.pipeline_version import PipelineVersion
 from src.postprocessing.confidence import (
@@ -27,6 +27,7 @@ from src.postprocessing.confidence import (
 )
 from src.postprocessing.customer_status import compute_customer_status, crm_lookup_mock
 from src.postprocessing.keyword_resolver import resolve_keywords_from_catalog
+from src.postprocessing.metrics import observe_layer_latency, record_span_status
 from src.postprocessing.output_builder import build_triage_output_schema
 from src.postprocessing.priority_scorer import PriorityScorer, priority_scorer
 from src.postprocessing.validation import (
@@ -40,7 +41,7 @@ logger = logging.getLogger(__name__)
 
 def postprocess_and_enrich(
     llm_output_raw: dict | str,
-    candidates: List[dict],
+    candidates: CandidatesLike,
     document: EmailDocument,
     pipeline_version: PipelineVersion,
     crm_lookup: Optional[Callable[[str], Tuple[str, float]]] = None,
@@ -63,7 +64,8 @@ def postprocess_and_enrich(
 
     Args:
         llm_output_raw: Raw LLM output (JSON string or dict).
-        candidates: Candidate keyword list with metadata.
+        candidates: Candidate keyword list with metadata, or a CandidateCatalog
+                    (reuse one across retries to build its index only once).
         document: Canonical EmailDocument.
         pipeline_version: PipelineVersion for traceability.
         crm_lookup: CRM lookup function. Defaults to mock.
@@ -74,24 +76,24 @@ def postprocess_and_enrich(
     Returns:
         Complete post-processing output dict conforming to POST_PROCESSING_OUTPUT_SCHEMA.
     """
-    start_time = time.monotonic()
+    start_ns = time.perf_counter_ns()
 
     if crm_lookup is None:
         crm_lookup = crm_lookup_mock
     if scorer is None:
         scorer = priority_scorer
-    if collision_index is None:
-        collision_index = build_collision_index(candidates)
+    # Wrap once: every stage below shares the catalog's candidateid index
+    catalog = CandidateCatalog.of(candidates)
 
-    validation_retries = 0
-    fallback_applied = False
+    if collision_index is None:
+        collision_index = build_collision_index(catalog)
 
     # ==================================================================
     # Stage 1: Validate & Normalize
     # ==================================================================
     validation_result = validate_llm_output_multistage(
         llm_output_raw,
-        candidates,
+        catalog,
         document.body_canonical,
     )
 
@@ -105,12 +107,15 @@ def postprocess_and_enrich(
 
     assert validation_result.data is not None
     triage_normalized: dict = validation_result.data
+    # Bound once: every stage below mutates this same topics list in place
+    topics: list = triage_normalized.setdefault("topics", [])
 
     # Check evidence policy
     if not enforce_evidence_policy(
-        triage_normalized.get("topics", []),
+        topics,
         document.body_canonical,
         threshold=evidence_threshold,
+        warnings=validation_result.evidence_warnings,
     ):
         logger.warning("Evidence policy failed — would trigger retry in production")
         # In production: retry LLM call here
@@ -120,15 +125,16 @@ def postprocess_and_enrich(
     # Replace LLM-generated spans with deterministically computed offsets.
     # Original LLM span is preserved as span_llm for audit purposes.
     # ==================================================================
-    triage_normalized["topics"] = enrich_evidence_with_spans(
-        triage_normalized.get("topics", []),
+    topics = triage_normalized["topics"] = enrich_evidence_with_spans(
+        topics,
         document.body_canonical,
+        text_hash=document.body_canonical_sha256,
     )
 
     # Compute per-status span counts from enriched evidence and record metrics.
     span_counts: dict = {"exact_match": 0, "fuzzy_match": 0, "not_found": 0}
-    for _topic in triage_normalized["topics"]:
-        for _ev in _topic.get("evidence", []):
+    for _topic in topics:
+        for _ev in _topic.get("evidence") or ():
             _status = _ev.get("span_status", "not_found")
             if _status in span_counts:
                 span_counts[_status] += 1
@@ -139,8 +145,8 @@ def postprocess_and_enrich(
     # diagnostics.warnings accurately reflects the *final* state of the data.
     _corrected = sum(
         1
-        for _t in triage_normalized["topics"]
-        for _e in _t.get("evidence", [])
+        for _t in topics
+        for _e in _t.get("evidence") or ()
         if _e.get("span_status") in ("exact_match", "fuzzy_match")
         and _e.get("span_llm") is not None
     )
@@ -156,7 +162,7 @@ def postprocess_and_enrich(
     # ==================================================================
     # Stage 2: Keyword Resolution from Catalog ★FIX #1★
     # ==================================================================
-    triage_normalized = resolve_keywords_from_catalog(triage_normalized, candidates)
+    triage_normalized = resolve_keywords_from_catalog(triage_normalized, catalog)
 
     # ==================================================================
     # Stage 3: Customer Status (deterministic)
@@ -176,6 +182,7 @@ def postprocess_and_enrich(
         sentiment_value=triage_normalized.get("sentiment", {}).get("value", "neutral"),
         customer_value=customer_status["value"],
         vip_status=False,  # TODO: lookup from external source
+        text_lower=f"{document.subject.lower()} {document.body_canonical_lower}",
     )
 
     # ==================================================================
@@ -183,17 +190,18 @@ def postprocess_and_enrich(
     # ==================================================================
     triage_with_conf = adjust_all_topic_confidences(
         triage_normalized,
-        candidates,
+        catalog,
         collision_index,
     )
 
     # ==================================================================
     # Stage 6: Observations + Output Normalization ★FIX #4★
     # ==================================================================
+    topics = triage_with_conf["topics"]
     observations = build_observations(
         document.message_id,
-        triage_with_conf.get("topics", []),
-        candidates,
+        topics,
+        catalog.candidates,
         pipeline_version.dictionaryversion,
     )
 
@@ -206,8 +214,9 @@ def postprocess_and_enrich(
     # ==================================================================
     # Assembly
     # ==================================================================
-    elapsed_ms = int((time.monotonic() - start_time) * 1000)
-    LAYER_LATENCY.labels(layer_name="postprocessing").observe(elapsed_ms / 1000.0)
+    elapsed_ns = time.perf_counter_ns() - start_ns
+    elapsed_ms = elapsed_ns // 1_000_000
+    observe_layer_latency("postprocessing", elapsed_ns / 1e9)
 
     return {
         "message_id": document.message_id,
@@ -218,14 +227,14 @@ def postprocess_and_enrich(
         "diagnostics": {
             "warnings": validation_result.warnings,
             "errors": validation_result.errors,
-            "validation_retries": validation_retries,
-            "fallback_applied": fallback_applied,
+            "validation_retries": 0,  # LLM retries happen upstream
+            "fallback_applied": False,
         },
         "processing_metadata": {
             "postprocessing_duration_ms": elapsed_ms,
             "entities_extracted": 0,
             "observations_created": len(observations),
-            "confidence_adjustments_applied": len(triage_with_conf.get("topics", [])),
+            "confidence_adjustments_applied": len(topics),
             "span_exact_match_count": span_counts["exact_match"],
             "span_fuzzy_match_count": span_counts["fuzzy_match"],
             "span_not_found_count": span_counts["not_found"],
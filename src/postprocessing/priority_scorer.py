@@ -13,10 +13,16 @@ Pesi (weights) are configurable and can be learned from historical data.
 Reference: post-processing-enrichment-layer.md §6
 """
 import re
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from src.config.constants import HIGH_TERMS, URGENT_TERMS
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    AHOCORASICK_AVAILABLE = False
+
 # Default weights (can be learned — see calibrate_from_data)
 DEFAULT_WEIGHTS: dict = {
     "urgent_terms": 3.0,
@@ -34,6 +40,49 @@ DEADLINE_PATTERNS: List[str] = [
     r"entro \d{1,2} giorni",
 ]
 
+# All deadline patterns fused into one precompiled alternation (single scan).
+_DEADLINE_RE: re.Pattern = re.compile(
+    "|".join(f"(?:{p})" for p in DEADLINE_PATTERNS),
+    re.IGNORECASE,
+)
+
+
+_URGENT_SET: frozenset = frozenset(URGENT_TERMS)
+_HIGH_SET: frozenset = frozenset(HIGH_TERMS)
+
+# One Aho–Corasick automaton over URGENT_TERMS ∪ HIGH_TERMS: a single pass
+# over the text finds every term of both classes.
+_TERM_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _TERM_AUTOMATON = ahocorasick.Automaton()
+    for _term in _URGENT_SET | _HIGH_SET:
+        _TERM_AUTOMATON.add_word(_term, _term)
+    _TERM_AUTOMATON.make_automaton()
+
+# Fallback without pyahocorasick: one regex pass. The lookahead matches at
+# every position (overlapping hits) and the longest-first alternation picks
+# the longest term starting there; shorter terms that are prefixes of it are
+# added back through _PREFIX_TERMS, so the result equals the substring test.
+_ALL_TERMS: Tuple[str, ...] = tuple(sorted(_URGENT_SET | _HIGH_SET, key=lambda t: (-len(t), t)))
+_TERM_RE: re.Pattern = re.compile(
+    "(?=(" + "|".join(re.escape(t) for t in _ALL_TERMS) + "))"
+)
+_PREFIX_TERMS: dict = {
+    term: frozenset(other for other in _ALL_TERMS if other != term and term.startswith(other))
+    for term in _ALL_TERMS
+}
+
+
+def _count_priority_terms(text: str) -> Tuple[int, int]:
+    """Return the number of distinct (URGENT_TERMS, HIGH_TERMS) occurring in *text*."""
+    if _TERM_AUTOMATON is not None:
+        found = {term for _, term in _TERM_AUTOMATON.iter(text)}
+    else:
+        found = set(_TERM_RE.findall(text))
+        for term in tuple(found):
+            found |= _PREFIX_TERMS[term]
+    return len(found & _URGENT_SET), len(found & _HIGH_SET)
+
 
 class PriorityScorer:
     """
@@ -56,6 +105,8 @@ class PriorityScorer:
         sentiment_value: str,
         customer_value: str,
         vip_status: bool = False,
+        text_lower: Optional[str] = None,
+        exhaustive_signals: bool = True,
     ) -> dict:
         """
         Compute priority score and bucket.
@@ -66,6 +117,12 @@ class PriorityScorer:
             sentiment_value: "positive" | "neutral" | "negative".
             customer_value: "new" | "existing" | "unknown".
             vip_status: Whether the sender is a VIP customer.
+            text_lower: Precomputed f"{subject} {body_canonical}".lower(),
+                        if the caller already has it.
+            exhaustive_signals: If False, stop once the score reaches the
+                        urgent threshold after steps 1-3: customer status,
+                        deadline regex and VIP are skipped. The bucket is
+                        unchanged, but signals and rawscore are then partial.
 
         Returns:
             {
@@ -75,18 +132,18 @@ class PriorityScorer:
                 "rawscore": float,
             }
         """
-        text = f"{subject} {body_canonical}".lower()
+        text = text_lower if text_lower is not None else f"{subject} {body_canonical}".lower()
         raw_score = 0.0
         signals: List[str] = []
 
+        urgent_count, high_count = _count_priority_terms(text)
+
         # 1. Urgent terms
-        urgent_count = sum(1 for term in URGENT_TERMS if term in text)
         if urgent_count > 0:
             raw_score += self.weights["urgent_terms"] * urgent_count
             signals.append(f"urgent_keywords:{urgent_count}")
 
         # 2. High priority terms
-        high_count = sum(1 for term in HIGH_TERMS if term in text)
         if high_count > 0:
             raw_score += self.weights["high_terms"] * high_count
             signals.append(f"high_keywords:{high_count}")
@@ -96,21 +153,34 @@ class PriorityScorer:
             raw_score += self.weights["sentiment_negative"]
             signals.append("negative_sentiment")
 
-        # 4. Customer status
-        if customer_value == "new":
-            raw_score += self.weights["customer_new"]
-            signals.append("new_customer")
-
-        # 5. Deadline
-        deadline_boost = self._extract_deadline_signals(text)
-        if deadline_boost > 0:
-            raw_score += self.weights["deadline_signal"] * deadline_boost
-            signals.append("deadline_mentioned")
-
-        # 6. VIP
-        if vip_status:
-            raw_score += self.weights["vip_customer"]
-            signals.append("vip_customer")
+        # Bucketing is monotonic in raw_score: once the urgent threshold is
+        # reached, steps 4-6 cannot change the bucket (with non-negative weights)
+        short_circuit = (
+            not exhaustive_signals
+            and raw_score >= 7.0
+            and min(
+                self.weights["customer_new"],
+                self.weights["deadline_signal"],
+                self.weights["vip_customer"],
+            ) >= 0
+        )
+
+        if not short_circuit:
+            # 4. Customer status
+            if customer_value == "new":
+                raw_score += self.weights["customer_new"]
+                signals.append("new_customer")
+
+            # 5. Deadline
+            deadline_boost = self._extract_deadline_signals(text)
+            if deadline_boost > 0:
+                raw_score += self.weights["deadline_signal"] * deadline_boost
+                signals.append("deadline_mentioned")
+
+            # 6. VIP
+            if vip_status:
+                raw_score += self.weights["vip_customer"]
+                signals.append("vip_customer")
 
         # Bucketing
         if raw_score >= 7.0:
@@ -140,9 +210,8 @@ class PriorityScorer:
         Returns:
             Urgency boost (0 = none, 2 = deadline found).
         """
-        for pattern in DEADLINE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return 2
+        if _DEADLINE_RE.search(text):
+            return 2
         return 0
 
     def calibrate_from_data(self, training_data) -> None:
@@ -12,14 +12,26 @@ Key scheme
   run:{run_id}:msg:{message_id}:layer:{layer_name}:raw         – raw output
   run:{run_id}:msg:{message_id}:layer:{layer_name}:normalized  – validated+enriched
 
+Hash layout (``hash_layout=True``): one hash per message, one expiry
+  run:{run_id}:msg:{message_id}  fields {layer_name}:raw, {layer_name}:normalized,
+                                        {layer_name}:error
+
 References: Pipeline-Problemi-Soluzioni-Contratti.md §5
 """
 from __future__ import annotations
 
 import json
 import logging
+import queue
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +39,46 @@ logger = logging.getLogger(__name__)
 DEFAULT_TTL_SECONDS: int = 86_400
 
 
+# ---------------------------------------------------------------------------
+# Payload (de)serialization — orjson if available, stdlib json otherwise
+# ---------------------------------------------------------------------------
+
+if ORJSON_AVAILABLE:
+    # numpy scalars/arrays are written natively as JSON numbers. No default=
+    # hook: anything else orjson does not serialize (datetimes, dataclasses,
+    # big ints, ...) raises and is handed to json.dumps(default=str), so its
+    # stored form is exactly the stdlib one.
+    # Non-finite floats (NaN, ±Infinity) are stored as null by orjson, where
+    # json.dumps wrote the non-standard NaN/Infinity tokens: valid JSON for
+    # every reader, at the cost of reading them back as None.
+    _ORJSON_OPTIONS: int = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _dumps(payload: Any) -> str:
+    """Serialize a payload for Redis (str, as returned by decode_responses=True)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(payload, option=_ORJSON_OPTIONS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(payload, default=str)
+
+
+def _loads(data: str | bytes) -> Any:
+    """Deserialize a payload read from Redis."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity tokens written by json.dumps (fallback or older payloads)
+    return json.loads(data)
+
+
 # ---------------------------------------------------------------------------
 # Lightweight result type for layer validators
 # ---------------------------------------------------------------------------
@@ -69,6 +121,9 @@ def process_layer_with_barrier(
     message_id: str,
     layer_name: str,
     ttl: int = DEFAULT_TTL_SECONDS,
+    background: bool = False,
+    hash_layout: bool = False,
+    validator_pure: bool = False,
 ) -> dict:
     """
     Execute a pipeline layer with a Redis write barrier.
@@ -83,6 +138,12 @@ def process_layer_with_barrier(
     5. Persist normalized output to Redis (``…:normalized`` key).
     6. Return normalized output **only**.
 
+    The Redis writes of steps 2, 3 and 5 are sent together in one pipelined
+    round-trip at the end (raw is written even if a callback raises).
+    With ``background=True`` the writes of a *successful* run are handed to
+    a background writer thread instead (see flush_barrier_writes()); failed
+    runs are still persisted synchronously before the error is raised.
+
     Args:
         input_data:    Input passed verbatim to layer_fn.
         layer_fn:      The layer callable; must return a JSON-serialisable dict.
@@ -94,6 +155,15 @@ def process_layer_with_barrier(
         message_id:    Email message-id for key namespacing.
         layer_name:    Human-readable layer name for key namespacing.
         ttl:           Key expiry in seconds (default 24 h).
+        background:    Enqueue the audit writes of a successful run instead of
+                       waiting for the Redis round-trip (default False).
+        hash_layout:   Store the payloads as fields of the per-message hash
+                       instead of one key each (default False; read them back
+                       with the same flag).
+        validator_pure: Promise that validator_fn never mutates raw_output.
+                       Without a normalizer_fn the raw serialization is then
+                       reused for the normalized key (default False: the
+                       validated output is serialized again).
 
     Returns:
         The normalized (validated + enriched) output dict.
@@ -101,11 +171,9 @@ def process_layer_with_barrier(
     Raises:
         WriteBarrierValidationError: If validation fails.
     """
-    safe_mid = _safe_mid(message_id)
-    key_prefix = f"run:{run_id}:msg:{safe_mid}:layer:{layer_name}"
-    key_raw = f"{key_prefix}:raw"
-    key_normalized = f"{key_prefix}:normalized"
-    key_error = f"{key_prefix}:error"
+    hash_key, key_raw, key_normalized, key_error = _layer_keys(
+        run_id, message_id, layer_name, hash_layout
+    )
 
     # ------------------------------------------------------------------
     # 1. Execute layer
@@ -115,13 +183,121 @@ def process_layer_with_barrier(
 
     # ------------------------------------------------------------------
     # 2. Persist raw (always, even on failure — needed for debugging)
+    #
+    # Writes are buffered and flushed in a single pipelined round-trip
+    # once the outcome is known: raw + error on failure, raw + normalized
+    # on success. The flush sits in a finally block so the raw payload is
+    # persisted even if the validator or normalizer raises.
     # ------------------------------------------------------------------
+    raw_payload = _dumps(raw_output)
+    writes: List[Tuple[str, str]] = [(key_raw, raw_payload)]
+    succeeded = False
+
     try:
-        redis_client.set(key_raw, json.dumps(raw_output, default=str), ex=ttl)
-        logger.debug("WriteBarrier[%s] raw payload persisted → %s", layer_name, key_raw)
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("WriteBarrier[%s] failed to persist raw: %s", layer_name, exc)
+        normalized, outcome = _validate_and_normalize(
+            raw_output, raw_payload if validator_pure else None, validator_fn, normalizer_fn,
+            writes, key_normalized, key_error, run_id, message_id, layer_name,
+        )
+        succeeded = True
+    finally:
+        if background and succeeded:
+            _enqueue_writes(redis_client, hash_key, writes, ttl, layer_name)
+        else:
+            _persist(redis_client, hash_key, writes, ttl, layer_name)
+
+    logger.info(
+        "WriteBarrier[%s] completed OK (warnings=%d)", layer_name, len(outcome.warnings)
+    )
+    return normalized
+
+
+async def aprocess_layer_with_barrier(
+    *,
+    input_data: Any,
+    layer_fn: Callable[[Any], dict],
+    validator_fn: Callable[[dict], ValidationOutcome],
+    normalizer_fn: Optional[Callable[[dict, ValidationOutcome], dict]] = None,
+    redis_client: Any,
+    run_id: str,
+    message_id: str,
+    layer_name: str,
+    ttl: int = DEFAULT_TTL_SECONDS,
+    hash_layout: bool = False,
+    validator_pure: bool = False,
+) -> dict:
+    """
+    Async variant of process_layer_with_barrier() for a redis.asyncio client.
 
+    The layer, validator and normalizer callables run synchronously as
+    before; only the pipelined Redis round-trip is awaited, so the event
+    loop can process other messages while the writes are in flight.
+    Same flow, keys, return value and exceptions as the sync version
+    (validator_pure included).
+    """
+    hash_key, key_raw, key_normalized, key_error = _layer_keys(
+        run_id, message_id, layer_name, hash_layout
+    )
+
+    logger.debug("WriteBarrier[%s] executing layer_fn …", layer_name)
+    raw_output: dict = layer_fn(input_data)
+
+    raw_payload = _dumps(raw_output)
+    writes: List[Tuple[str, str]] = [(key_raw, raw_payload)]
+
+    try:
+        normalized, outcome = _validate_and_normalize(
+            raw_output, raw_payload if validator_pure else None, validator_fn, normalizer_fn,
+            writes, key_normalized, key_error, run_id, message_id, layer_name,
+        )
+    finally:
+        await _apersist(redis_client, hash_key, writes, ttl, layer_name)
+
+    logger.info(
+        "WriteBarrier[%s] completed OK (warnings=%d)", layer_name, len(outcome.warnings)
+    )
+    return normalized
+
+
+def _layer_keys(
+    run_id: str,
+    message_id: str,
+    layer_name: str,
+    hash_layout: bool,
+) -> Tuple[Optional[str], str, str, str]:
+    """(hash_key, raw, normalized, error) keys — field names with the hash layout."""
+    if hash_layout:
+        return (
+            _hash_key(run_id, message_id),
+            layer_name + ":raw",
+            layer_name + ":normalized",
+            layer_name + ":error",
+        )
+    key_prefix = _key_prefix(run_id, message_id, layer_name)
+    return None, key_prefix + ":raw", key_prefix + ":normalized", key_prefix + ":error"
+
+
+def _validate_and_normalize(
+    raw_output: dict,
+    raw_payload: Optional[str],
+    validator_fn: Callable[[dict], ValidationOutcome],
+    normalizer_fn: Optional[Callable[[dict, ValidationOutcome], dict]],
+    writes: List[Tuple[str, str]],
+    key_normalized: str,
+    key_error: str,
+    run_id: str,
+    message_id: str,
+    layer_name: str,
+) -> Tuple[dict, ValidationOutcome]:
+    """
+    Steps 3–5 of the barrier: validate, normalize and buffer the resulting
+    write (error record or normalized payload) in *writes*.
+
+    *raw_payload* is raw_output's serialization when the caller vouches that
+    validator_fn leaves raw_output untouched, else None.
+
+    Raises:
+        WriteBarrierValidationError: If validation fails.
+    """
     # ------------------------------------------------------------------
     # 3. Validate
     # ------------------------------------------------------------------
@@ -135,10 +311,7 @@ def process_layer_with_barrier(
             "errors": outcome.errors,
             "warnings": outcome.warnings,
         }
-        try:
-            redis_client.set(key_error, json.dumps(error_payload, default=str), ex=ttl)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("WriteBarrier[%s] failed to persist error record: %s", layer_name, exc)
+        writes.append((key_error, _dumps(error_payload)))
 
         try:
             from src.postprocessing.metrics import record_barrier_block, record_validation_error
@@ -163,33 +336,179 @@ def process_layer_with_barrier(
         normalized = raw_output
 
     # ------------------------------------------------------------------
-    # 5. Persist normalized (only on success)
+    # 5. Persist normalized (only on success). Without a normalizer and
+    #    with a pure validator the normalized payload *is* the raw one:
+    #    reuse its serialization.
     # ------------------------------------------------------------------
+    if normalizer_fn is None and raw_payload is not None:
+        normalized_payload = raw_payload
+    else:
+        normalized_payload = _dumps(normalized)
+    writes.append((key_normalized, normalized_payload))
+    return normalized, outcome
+
+
+# ---------------------------------------------------------------------------
+# Convenience helpers
+# ---------------------------------------------------------------------------
+
+def _persist(
+    redis_client: Any,
+    hash_key: Optional[str],
+    writes: List[Tuple[str, str]],
+    ttl: int,
+    layer_name: str,
+) -> None:
+    """
+    SET every (key, value) in *writes* with expiry *ttl* — or, when
+    *hash_key* is given, HSET them as fields of that hash and EXPIRE it once.
+
+    Uses a non-transactional Redis pipeline (one round-trip) when the client
+    supports it; clients without ``pipeline()`` (NullRedisClient, test stubs)
+    get sequential commands. Persistence failures are logged, never raised.
+    """
     try:
-        redis_client.set(key_normalized, json.dumps(normalized, default=str), ex=ttl)
-        logger.debug("WriteBarrier[%s] normalized payload persisted → %s", layer_name, key_normalized)
+        if hasattr(redis_client, "pipeline"):
+            with redis_client.pipeline(transaction=False) as pipe:
+                _queue_writes(pipe, hash_key, writes, ttl)
+                pipe.execute()
+        else:
+            _queue_writes(redis_client, hash_key, writes, ttl)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "WriteBarrier[%s] persisted → %s", layer_name, ", ".join(k for k, _ in writes)
+            )
     except Exception as exc:  # noqa: BLE001
-        logger.warning("WriteBarrier[%s] failed to persist normalized: %s", layer_name, exc)
+        logger.warning("WriteBarrier[%s] failed to persist payloads: %s", layer_name, exc)
 
-    logger.info(
-        "WriteBarrier[%s] completed OK (warnings=%d)", layer_name, len(outcome.warnings)
-    )
-    return normalized
+
+async def _apersist(
+    redis_client: Any,
+    hash_key: Optional[str],
+    writes: List[Tuple[str, str]],
+    ttl: int,
+    layer_name: str,
+) -> None:
+    """Async counterpart of _persist() for redis.asyncio clients."""
+    try:
+        if hasattr(redis_client, "pipeline"):
+            async with redis_client.pipeline(transaction=False) as pipe:
+                _queue_writes(pipe, hash_key, writes, ttl)
+                await pipe.execute()
+        elif hash_key is None:
+            for key, value in writes:
+                await redis_client.set(key, value, ex=ttl)
+        else:
+            await redis_client.hset(hash_key, mapping=dict(writes))
+            await redis_client.expire(hash_key, ttl)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "WriteBarrier[%s] persisted → %s", layer_name, ", ".join(k for k, _ in writes)
+            )
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("WriteBarrier[%s] failed to persist payloads: %s", layer_name, exc)
+
+
+def _queue_writes(
+    target: Any,
+    hash_key: Optional[str],
+    writes: List[Tuple[str, str]],
+    ttl: int,
+) -> None:
+    """Issue the write commands on *target* (a pipeline or the client itself)."""
+    if hash_key is None:
+        for key, value in writes:
+            target.set(key, value, ex=ttl)
+    else:
+        target.hset(hash_key, mapping=dict(writes))
+        target.expire(hash_key, ttl)
 
 
 # ---------------------------------------------------------------------------
-# Convenience helpers
+# Background writer (process_layer_with_barrier(..., background=True))
 # ---------------------------------------------------------------------------
 
+# Max queued layer runs merged into one pipelined round-trip
+_WRITE_BATCH_SIZE: int = 256
+
+_write_queue: "queue.Queue[Tuple[Any, Optional[str], List[Tuple[str, str]], int, str]]" = (
+    queue.Queue()
+)
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _drain_loop() -> None:
+    """Writer thread: persist queued writes, merging whatever is pending."""
+    while True:
+        batch = [_write_queue.get()]
+        while len(batch) < _WRITE_BATCH_SIZE:
+            try:
+                batch.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        # One round-trip per (client, hash, ttl, layer) instead of one per run
+        merged: Dict[
+            Tuple[int, Optional[str], int, str], Tuple[Any, List[Tuple[str, str]]]
+        ] = {}
+        for redis_client, hash_key, writes, ttl, layer_name in batch:
+            entry = merged.setdefault(
+                (id(redis_client), hash_key, ttl, layer_name), (redis_client, [])
+            )
+            entry[1].extend(writes)
+        for (_, hash_key, ttl, layer_name), (redis_client, writes) in merged.items():
+            _persist(redis_client, hash_key, writes, ttl, layer_name)
+
+        for _ in batch:
+            _write_queue.task_done()
+
+
+def _enqueue_writes(
+    redis_client: Any,
+    hash_key: Optional[str],
+    writes: List[Tuple[str, str]],
+    ttl: int,
+    layer_name: str,
+) -> None:
+    """Hand *writes* to the background writer, starting it on first use."""
+    global _writer_thread
+    if _writer_thread is None or not _writer_thread.is_alive():
+        with _writer_lock:
+            if _writer_thread is None or not _writer_thread.is_alive():
+                _writer_thread = threading.Thread(
+                    target=_drain_loop, name="redis-barrier-writer", daemon=True
+                )
+                _writer_thread.start()
+    _write_queue.put_nowait((redis_client, hash_key, writes, ttl, layer_name))
+
+
+def flush_barrier_writes() -> None:
+    """Block until every background barrier write has been persisted.
+
+    Call at shutdown (the writer is a daemon thread) and before reading back
+    payloads written with ``background=True``.
+    """
+    _write_queue.join()
+
+
+# "<", ">" removed; " ", "/" → "_"
+_SAFE_MID_TABLE: Dict[int, Optional[str]] = str.maketrans({"<": None, ">": None, " ": "_", "/": "_"})
+
+
 def _safe_mid(message_id: str) -> str:
     """Strip/replace characters that are unsafe in Redis key names."""
-    return (
-        message_id
-        .replace("<", "")
-        .replace(">", "")
-        .replace(" ", "_")
-        .replace("/", "_")
-    )
+    return message_id.translate(_SAFE_MID_TABLE)
+
+
+def _key_prefix(run_id: str, message_id: str, layer_name: str) -> str:
+    """Key prefix of a layer run, shared by the barrier and the getters."""
+    return f"run:{run_id}:msg:{_safe_mid(message_id)}:layer:{layer_name}"
+
+
+def _hash_key(run_id: str, message_id: str) -> str:
+    """Key of the per-message hash used by the hash layout."""
+    return f"run:{run_id}:msg:{_safe_mid(message_id)}"
 
 
 def get_raw_payload(
@@ -197,11 +516,23 @@ def get_raw_payload(
     run_id: str,
     message_id: str,
     layer_name: str,
-) -> Optional[dict]:
-    """Retrieve the raw payload for a layer run, or None if not found."""
-    key = f"run:{run_id}:msg:{_safe_mid(message_id)}:layer:{layer_name}:raw"
-    data = redis_client.get(key)
-    return json.loads(data) if data else None
+    hash_layout: bool = False,
+    decode: bool = True,
+) -> Optional[dict | str | bytes]:
+    """
+    Retrieve the raw payload for a layer run, or None if not found.
+
+    With ``decode=False`` the stored JSON is returned as-is (str, or bytes
+    from a ``decode_responses=False`` client) without parsing it — for
+    existence checks or forwarding the payload to another store.
+    """
+    if hash_layout:
+        data = redis_client.hget(_hash_key(run_id, message_id), layer_name + ":raw")
+    else:
+        data = redis_client.get(_key_prefix(run_id, message_id, layer_name) + ":raw")
+    if not data:
+        return None
+    return _loads(data) if decode else data
 
 
 def get_normalized_payload(
@@ -209,11 +540,57 @@ def get_normalized_payload(
     run_id: str,
     message_id: str,
     layer_name: str,
-) -> Optional[dict]:
-    """Retrieve the normalized payload for a layer run, or None if not found."""
-    key = f"run:{run_id}:msg:{_safe_mid(message_id)}:layer:{layer_name}:normalized"
-    data = redis_client.get(key)
-    return json.loads(data) if data else None
+    hash_layout: bool = False,
+    decode: bool = True,
+) -> Optional[dict | str | bytes]:
+    """
+    Retrieve the normalized payload for a layer run, or None if not found.
+
+    With ``decode=False`` the stored JSON is returned as-is (str, or bytes
+    from a ``decode_responses=False`` client) without parsing it — for
+    existence checks or forwarding the payload to another store.
+    """
+    if hash_layout:
+        data = redis_client.hget(_hash_key(run_id, message_id), layer_name + ":normalized")
+    else:
+        data = redis_client.get(_key_prefix(run_id, message_id, layer_name) + ":normalized")
+    if not data:
+        return None
+    return _loads(data) if decode else data
+
+
+def get_all_layer_payloads(
+    redis_client: Any,
+    run_id: str,
+    message_id: str,
+    layer_names: List[str],
+    hash_layout: bool = False,
+) -> Dict[str, Dict[str, Optional[dict]]]:
+    """
+    Retrieve raw and normalized payloads of several layers in one MGET
+    (one HMGET with the hash layout).
+
+    Returns:
+        {layer_name: {"raw": dict | None, "normalized": dict | None}}
+    """
+    if hash_layout:
+        fields = [name + ":raw" for name in layer_names] + [
+            name + ":normalized" for name in layer_names
+        ]
+        values = redis_client.hmget(_hash_key(run_id, message_id), fields) if fields else []
+    else:
+        prefixes = [_key_prefix(run_id, message_id, name) for name in layer_names]
+        keys = [p + ":raw" for p in prefixes] + [p + ":normalized" for p in prefixes]
+        values = redis_client.mget(keys) if keys else []
+
+    n = len(layer_names)
+    return {
+        name: {
+            "raw": _loads(values[i]) if values[i] else None,
+            "normalized": _loads(values[n + i]) if values[n + i] else None,
+        }
+        for i, name in enumerate(layer_names)
+    }
 
 
 def build_redis_client(url: Optional[str] = None) -> Any:
@@ -239,6 +616,36 @@ def build_redis_client(url: Optional[str] = None) -> Any:
     return client
 
 
+def build_async_redis_client(
+    url: Optional[str] = None,
+    max_connections: Optional[int] = None,
+) -> Any:
+    """
+    Build and return a redis.asyncio.Redis client on a shared connection pool
+    (for aprocess_layer_with_barrier()).
+
+    Falls back to REDIS_URL from settings if *url* is not provided.
+    Raises ImportError if the `redis` package is not installed.
+    """
+    try:
+        import redis.asyncio as _aredis
+    except ImportError as exc:
+        raise ImportError(
+            "The 'redis' package is required for the write barrier. "
+            "Install it with: pip install redis"
+        ) from exc
+
+    from src.config.settings import REDIS_URL
+
+    target_url = url or REDIS_URL
+    pool = _aredis.ConnectionPool.from_url(
+        target_url, decode_responses=True, max_connections=max_connections
+    )
+    client = _aredis.Redis(connection_pool=pool)
+    logger.debug("Async Redis client created for URL: %s", target_url)
+    return client
+
+
 # ---------------------------------------------------------------------------
 # Null / no-op client (for testing without a live Redis instance)
 # ---------------------------------------------------------------------------
@@ -255,6 +662,22 @@ class NullRedisClient:
     def get(self, key: str) -> None:  # noqa: ARG002
         return None
 
+    def mget(self, keys: List[str]) -> List[None]:
+        return [None] * len(keys)
+
+    def hset(self, name: str, key: Optional[str] = None, value: Optional[str] = None,  # noqa: ARG002
+             **kwargs: Any) -> int:
+        return 0
+
+    def hget(self, name: str, key: str) -> None:  # noqa: ARG002
+        return None
+
+    def hmget(self, name: str, keys: List[str]) -> List[None]:  # noqa: ARG002
+        return [None] * len(keys)
+
+    def expire(self, name: str, time: int) -> bool:  # noqa: ARG002
+        return False
+
     def exists(self, *keys: str) -> int:
         return 0
 
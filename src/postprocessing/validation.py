@@ -14,22 +14,78 @@ References: post-processing-enrichment-layer.md §3.1, §4
 import hashlib
 import json
 import logging
-from typing import List
-
-import numpy as np
-from jsonschema import ValidationError, validate
+import math
+from collections import Counter
+from functools import lru_cache
+from typing import Collection, Dict, FrozenSet, List, Set
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    FASTJSONSCHEMA_AVAILABLE = False
+
+try:
+    from rapidfuzz.fuzz import partial_ratio_alignment
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    RAPIDFUZZ_AVAILABLE = False
 
 from src.config.constants import LABELID_ALIASES, MIN_CONFIDENCE_WARNING, TOPICS_ENUM
 from src.config.schemas import LLM_RESPONSE_SCHEMA
+from src.models.candidate_catalog import CandidateCatalog, CandidatesLike
 from src.models.validation import ValidationResult
 
 logger = logging.getLogger(__name__)
 
+# Membership sets built once (TOPICS_ENUM stays a list: the JSON schema enum needs one)
+_ALLOWED_TOPICS_SET: FrozenSet[str] = frozenset(TOPICS_ENUM)
+
+# Fields the LLM naturally echoes from the candidate prompt into keywordsintext
+_KNOWN_LLM_ECHO_FIELDS: FrozenSet[str] = frozenset(
+    {"candidateid", "lemma", "count", "term", "source", "embeddingscore"}
+)
+
+# LLM response schema validators, built once at import. jsonschema.validate()
+# would re-check the schema and rebuild the validator on every call.
+_LLM_SCHEMA: dict = LLM_RESPONSE_SCHEMA["schema"]
+_LLM_SCHEMA_VALIDATOR = validator_for(_LLM_SCHEMA)(_LLM_SCHEMA)
+
+# fastjsonschema (compiled to straight-line Python) as a fast path for the
+# common valid case; use_default=False so it never mutates the payload.
+_llm_schema_fast_check = None
+if FASTJSONSCHEMA_AVAILABLE:
+    _llm_schema_fast_check = fastjsonschema.compile(_LLM_SCHEMA, use_default=False, use_formats=False)
+
 
 # ======================================================================
 # Internal helpers
 # ======================================================================
 
+def _llm_schema_error(data: dict) -> str | None:
+    """
+    Validate *data* against LLM_RESPONSE_SCHEMA; return the error message
+    (same as jsonschema.validate() would raise) or None if valid.
+    """
+    if _llm_schema_fast_check is not None:
+        try:
+            _llm_schema_fast_check(data)
+            return None
+        except fastjsonschema.JsonSchemaException:
+            pass  # report with jsonschema's (best-match) message below
+    error = best_match(_LLM_SCHEMA_VALIDATOR.iter_errors(data))
+    return None if error is None else error.message
+
+
 def _normalize_labelid_aliases(data: dict, warnings: List[str]) -> dict:
     """
     Remap LLM-generated labelid variants to canonical TOPICS_ENUM values,
@@ -40,7 +96,7 @@ def _normalize_labelid_aliases(data: dict, warnings: List[str]) -> dict:
     Appends a warning for every alias/strip that is resolved.
     """
     normalized_topics = []
-    for topic in data.get("topics", []):
+    for topic in data.get("topics") or ():
         topic = dict(topic)
 
         # --- Alias normalization ---
@@ -58,10 +114,9 @@ def _normalize_labelid_aliases(data: dict, warnings: List[str]) -> dict:
         # resolve_keywords_from_catalog() will repopulate all fields from the trusted
         # catalog, so we silently discard anything beyond candidateid here.
         # Only warn for truly unexpected fields beyond the known LLM echo set.
-        KNOWN_LLM_ECHO_FIELDS = {"candidateid", "lemma", "count", "term", "source", "embeddingscore"}
         clean_kws = []
-        for kw in topic.get("keywordsintext", []):
-            truly_unexpected = set(kw.keys()) - KNOWN_LLM_ECHO_FIELDS
+        for kw in topic.get("keywordsintext") or ():
+            truly_unexpected = kw.keys() - _KNOWN_LLM_ECHO_FIELDS
             if truly_unexpected:
                 warnings.append(
                     f"keywordsintext: stripped unexpected fields {sorted(truly_unexpected)} "
@@ -79,9 +134,9 @@ def _normalize_labelid_aliases(data: dict, warnings: List[str]) -> dict:
 
 def validate_llm_output_multistage(
     output_json: str | dict,
-    candidates: List[dict],
+    candidates: CandidatesLike,
     text_canonical: str,
-    allowed_topics: List[str] | None = None,
+    allowed_topics: Collection[str] | None = None,
 ) -> ValidationResult:
     """
     Multi-stage validation of LLM output.
@@ -96,15 +151,18 @@ def validate_llm_output_multistage(
 
     Args:
         output_json: Raw JSON string from LLM.
-        candidates: List of candidate keyword dicts.
+        candidates: List of candidate keyword dicts (or a CandidateCatalog).
         text_canonical: Canonical email body text.
-        allowed_topics: Allowed topic labels (defaults to TOPICS_ENUM).
+        allowed_topics: Allowed topic labels (defaults to TOPICS_ENUM); any
+                        collection, checked as a set.
 
     Returns:
         ValidationResult with valid flag, errors, warnings, and cleaned data.
     """
     if allowed_topics is None:
-        allowed_topics = TOPICS_ENUM
+        allowed_topics = _ALLOWED_TOPICS_SET
+    elif not isinstance(allowed_topics, (set, frozenset)):
+        allowed_topics = frozenset(allowed_topics)
 
     errors: List[str] = []
     warnings: List[str] = []
@@ -129,47 +187,64 @@ def validate_llm_output_multistage(
     # ------------------------------------------------------------------
     # Stage 2: Schema validation
     # ------------------------------------------------------------------
-    try:
-        validate(instance=data, schema=LLM_RESPONSE_SCHEMA["schema"])
-    except ValidationError as e:
-        errors.append(f"Schema violation: {e.message}")
+    schema_error = _llm_schema_error(data)
+    if schema_error is not None:
+        errors.append(f"Schema violation: {schema_error}")
         return ValidationResult(valid=False, errors=errors, warnings=warnings)
 
     # ------------------------------------------------------------------
-    # Stage 3: Business rules
+    # Stages 3–5 in a single pass over the topics:
+    #   3. Business rules (labelid in enum, candidateid exists)
+    #   4. Evidence verification ★FIX #7★
+    #   5. Quality checks (confidence, keywords, evidence)
+    # Evidence and quality warnings are collected separately so that
+    # all evidence warnings still precede all quality warnings.
     # ------------------------------------------------------------------
-    candidate_ids = {c["candidateid"] for c in candidates}
+    candidate_ids = CandidateCatalog.of(candidates).by_id
+    topics = data.get("topics") or ()
+    found_quotes = _locate_quotes(topics, text_canonical)
+    evidence_warnings: List[str] = []
+    quality_warnings: List[str] = []
+    # Evidence warnings of the first topic per labelid, i.e. of the topics
+    # that survive deduplication (stage 6)
+    kept_evidence_warnings: List[str] = []
+    seen_labels: Set[str] = set()
 
-    for topic in data.get("topics", []):
-        # Check labelid in enum
-        if topic["labelid"] not in allowed_topics:
-            errors.append(f"Invalid labelid: {topic['labelid']}")
+    for topic in topics:
+        labelid = topic["labelid"]
+        keywordsintext = topic.get("keywordsintext") or ()
+        evidence = topic.get("evidence") or ()
 
-        # Check candidateid exists in candidate list
-        for kw in topic.get("keywordsintext", []):
+        # 3. Check labelid in enum
+        if labelid not in allowed_topics:
+            errors.append(f"Invalid labelid: {labelid}")
+
+        # 3. Check candidateid exists in candidate list
+        for kw in keywordsintext:
             cid = kw.get("candidateid")
             if cid not in candidate_ids:
                 errors.append(f"Invented candidateid: {cid}")
 
-    # ------------------------------------------------------------------
-    # Stage 4: Evidence verification ★FIX #7★
-    # ------------------------------------------------------------------
-    evidence_warnings = verify_evidence_quotes(data.get("topics", []), text_canonical)
-    warnings.extend(evidence_warnings)
+        # 4. Evidence verification
+        n_before = len(evidence_warnings)
+        _verify_evidence_items(evidence, text_canonical, found_quotes, evidence_warnings)
+        if labelid not in seen_labels:
+            seen_labels.add(labelid)
+            kept_evidence_warnings.extend(evidence_warnings[n_before:])
 
-    # ------------------------------------------------------------------
-    # Stage 5: Quality checks
-    # ------------------------------------------------------------------
-    for topic in data.get("topics", []):
+        # 5. Quality checks
         conf = topic.get("confidence", 0)
         if conf < MIN_CONFIDENCE_WARNING:
-            warnings.append(f"Very low confidence for {topic['labelid']}: {conf}")
+            quality_warnings.append(f"Very low confidence for {labelid}: {conf}")
 
-        if len(topic.get("keywordsintext", [])) == 0:
-            warnings.append(f"No keywords for topic {topic['labelid']}")
+        if len(keywordsintext) == 0:
+            quality_warnings.append(f"No keywords for topic {labelid}")
 
-        if len(topic.get("evidence", [])) == 0:
-            warnings.append(f"No evidence for topic {topic['labelid']}")
+        if len(evidence) == 0:
+            quality_warnings.append(f"No evidence for topic {labelid}")
+
+    warnings.extend(evidence_warnings)
+    warnings.extend(quality_warnings)
 
     # ------------------------------------------------------------------
     # Stage 6: Deduplication & normalization
@@ -177,51 +252,161 @@ def validate_llm_output_multistage(
     data = deduplicate_and_normalize(data)
 
     valid = len(errors) == 0
-    return ValidationResult(valid=valid, errors=errors, warnings=warnings, data=data)
+    return ValidationResult(
+        valid=valid,
+        errors=errors,
+        warnings=warnings,
+        data=data,
+        evidence_warnings=kept_evidence_warnings,
+    )
 
 
 # ======================================================================
 # Evidence Verification ★FIX #7★
 # ======================================================================
 
-def verify_evidence_quotes(topics: List[dict], text_canonical: str) -> List[str]:
+# Above this many distinct quotes (with pyahocorasick available) the quotes
+# are located with one Aho–Corasick pass over the text instead of one
+# substring scan per quote.
+_AUTOMATON_MIN_QUOTES: int = 8
+
+
+def _find_quotes(quotes: Set[str], text_canonical: str) -> Set[str]:
+    """Return the subset of *quotes* occurring in *text_canonical*."""
+    if AHOCORASICK_AVAILABLE and len(quotes) > _AUTOMATON_MIN_QUOTES:
+        automaton = ahocorasick.Automaton()
+        for quote in quotes:
+            automaton.add_word(quote, quote)
+        automaton.make_automaton()
+        return {quote for _, quote in automaton.iter(text_canonical)}
+    return {quote for quote in quotes if quote in text_canonical}
+
+
+def _span_locates(span: list | None, quote: str, text_canonical: str) -> bool:
+    """True if *span* is an in-bounds ``[start, end]`` that extracts exactly *quote*."""
+    if not span or len(span) != 2:
+        return False
+    start, end = span
+    return (
+        0 <= start < end <= len(text_canonical)
+        and end - start == len(quote)
+        and text_canonical.startswith(quote, start)
+    )
+
+
+def _locate_quotes(
+    topics: Collection[dict],
+    text_canonical: str,
+    checked: Set[str] | None = None,
+) -> Set[str]:
+    """
+    Distinct non-empty evidence quotes of *topics* that occur in
+    *text_canonical*. Quotes already in *checked* are skipped; the ones
+    examined here are added to it.
+
+    A quote whose span already extracts it is proven present by an
+    O(|quote|) compare; only the remaining quotes are searched for.
+    """
+    proven: Set[str] = set()
+    pending: Set[str] = set()
+    for topic in topics:
+        for ev in topic.get("evidence") or ():
+            quote = ev.get("quote")
+            if not quote or (checked is not None and quote in checked):
+                continue
+            if _span_locates(ev.get("span"), quote, text_canonical):
+                proven.add(quote)
+            else:
+                pending.add(quote)
+    pending -= proven
+    if checked is not None:
+        checked |= proven | pending
+    if not pending:
+        return proven
+    return proven | _find_quotes(pending, text_canonical)
+
+
+def _verify_evidence_items(
+    evidence: List[dict],
+    text_canonical: str,
+    found_quotes: Set[str],
+    warnings: List[str],
+) -> None:
+    """
+    Append a warning for every evidence item whose quote is not in
+    *found_quotes* or whose span does not extract the quote.
+    """
+    for ev in evidence:
+        quote = ev.get("quote", "")
+        span = ev.get("span")
+
+        if quote:
+            # Check if quote is a substring
+            if quote not in found_quotes:
+                warnings.append(
+                    f"Evidence quote not found in text: '{quote[:50]}...'"
+                )
+
+            # If span provided, verify consistency
+            if span and len(span) == 2:
+                start, end = span
+                if 0 <= start < end <= len(text_canonical):
+                    # Compare in place; the slice is only built for the warning
+                    if not _span_locates(span, quote, text_canonical):
+                        extracted = text_canonical[start:end]
+                        warnings.append(
+                            f"Span mismatch: span=[{start},{end}] extracts "
+                            f"'{extracted[:30]}...' but quote is '{quote[:30]}...'"
+                        )
+                else:
+                    warnings.append(
+                        f"Span out of bounds: [{start},{end}] for text length {len(text_canonical)}"
+                    )
+
+
+def verify_evidence_quotes(
+    topics: List[dict],
+    text_canonical: str,
+    max_failures: int | None = None,
+) -> List[str]:
     """
     Verify that evidence quotes actually appear in the canonical text.
     Also checks span consistency if span is provided.
 
+    Args:
+        topics: List of topic dicts.
+        text_canonical: Canonical email text.
+        max_failures: Stop after the first topic that brings the warning
+                      count above this value (the result is then a prefix
+                      of the full list). None checks every topic.
+
     Returns:
         List of warning strings for failed verifications.
     """
     warnings: List[str] = []
+    checked: Set[str] = set()
 
+    # Without a budget every quote is needed: locate them all in one pass.
+    # With one, quotes are located topic by topic so the scan stops too.
+    found_quotes = _locate_quotes(topics, text_canonical) if max_failures is None else set()
     for topic in topics:
-        for ev in topic.get("evidence", []):
-            quote = ev.get("quote", "")
-            span = ev.get("span")
+        if max_failures is not None:
+            found_quotes |= _locate_quotes((topic,), text_canonical, checked)
+        _verify_evidence_items(topic.get("evidence") or (), text_canonical, found_quotes, warnings)
+        if max_failures is not None and len(warnings) > max_failures:
+            break
 
-            if quote:
-                # Check if quote is a substring
-                if quote not in text_canonical:
-                    warnings.append(
-                        f"Evidence quote not found in text: '{quote[:50]}...'"
-                    )
+    return warnings
 
-                # If span provided, verify consistency
-                if span and len(span) == 2:
-                    start, end = span
-                    if 0 <= start < end <= len(text_canonical):
-                        extracted = text_canonical[start:end]
-                        if extracted != quote:
-                            warnings.append(
-                                f"Span mismatch: span=[{start},{end}] extracts "
-                                f"'{extracted[:30]}...' but quote is '{quote[:30]}...'"
-                            )
-                    else:
-                        warnings.append(
-                            f"Span out of bounds: [{start},{end}] for text length {len(text_canonical)}"
-                        )
 
-    return warnings
+# Minimum similarity of a fuzzy span match (rapidfuzz score_cutoff / 100)
+_FUZZY_MIN_RATIO: float = 0.85
+
+
+@lru_cache(maxsize=8)
+def _char_counts(text: str) -> Counter:
+    """Character multiset of *text* (cached: all quotes of an email share the body)."""
+    return Counter(text)
 
 
 def compute_span_from_quote(
@@ -229,13 +414,18 @@ def compute_span_from_quote(
     body_canonical: str,
 ) -> tuple[list[int] | None, str]:
     """
-    Calculate the byte-offset span ``[start, end]`` for *quote* inside
-    *body_canonical*.
+    Calculate the span ``[start, end]`` of *quote* inside *body_canonical*.
+
+    Offsets are character (code point) indices, not UTF-8 byte offsets, so
+    that ``body_canonical[start:end]`` extracts the match — the same
+    convention used for LLM spans by the evidence verification.
 
     Strategy:
         1. Exact substring match — status ``"exact_match"``.
-        2. Fuzzy sliding-window match via :func:`difflib.SequenceMatcher`
-           with a minimum ratio of 0.85 — status ``"fuzzy_match"``.
+        2. Fuzzy match with a minimum similarity of 0.85 — status
+           ``"fuzzy_match"``: :func:`rapidfuzz.fuzz.partial_ratio_alignment`
+           (C++, returns the aligned span directly) when rapidfuzz is
+           installed, else a :class:`difflib.SequenceMatcher` sliding window.
         3. Not found — returns ``(None, "not_found")``.
 
     Returns:
@@ -251,21 +441,41 @@ def compute_span_from_quote(
         return [start, start + len(quote)], "exact_match"
 
     # --- Fuzzy match ---
+    q_len = len(quote)
+    if q_len > len(body_canonical):
+        return None, "not_found"
+
+    # Admissible upper bound on the similarity of any window: a match can
+    # only use characters the body has (multiset intersection I), and
+    # 2·M / (|quote| + |window|) ≤ 2·I / (|quote| + I). Hallucinated
+    # quotes usually fail it, skipping the fuzzy scan entirely.
+    body_counts = _char_counts(body_canonical)
+    shared = sum(min(n, body_counts[ch]) for ch, n in Counter(quote).items())
+    if 2 * shared < _FUZZY_MIN_RATIO * (q_len + shared):
+        return None, "not_found"
+
+    if RAPIDFUZZ_AVAILABLE:
+        alignment = partial_ratio_alignment(
+            quote, body_canonical, score_cutoff=_FUZZY_MIN_RATIO * 100
+        )
+        if alignment is not None:
+            return [alignment.dest_start, alignment.dest_end], "fuzzy_match"
+        return None, "not_found"
+
     from difflib import SequenceMatcher
 
     best_ratio = 0.0
     best_span: list[int] | None = None
-    q_len = len(quote)
     window_size = q_len + 20
 
-    for i in range(max(0, len(body_canonical) - q_len + 1)):
+    for i in range(len(body_canonical) - q_len + 1):
         window = body_canonical[i : i + window_size]
         ratio = SequenceMatcher(None, quote, window, autojunk=False).ratio()
         if ratio > best_ratio:
             best_ratio = ratio
             best_span = [i, i + q_len]
 
-    if best_ratio >= 0.85 and best_span is not None:
+    if best_ratio >= _FUZZY_MIN_RATIO and best_span is not None:
         return best_span, "fuzzy_match"
 
     return None, "not_found"
@@ -274,6 +484,7 @@ def compute_span_from_quote(
 def enrich_evidence_with_spans(
     topics: List[dict],
     body_canonical: str,
+    text_hash: str | None = None,
 ) -> List[dict]:
     """
     Enrich every evidence item in *topics* with a server-computed span.
@@ -288,13 +499,17 @@ def enrich_evidence_with_spans(
     The LLM-supplied span (if present) is moved to ``span_llm`` and
     replaced with the server-computed value.
 
+    *text_hash* may be passed precomputed (e.g.
+    ``EmailDocument.body_canonical_sha256``) to skip hashing the body again.
+
     Returns:
         The (mutated) topics list with enriched evidence dicts.
     """
-    text_hash = hashlib.sha256(body_canonical.encode()).hexdigest()
+    if text_hash is None:
+        text_hash = hashlib.sha256(body_canonical.encode()).hexdigest()
 
     for topic in topics:
-        for ev in topic.get("evidence", []):
+        for ev in topic.get("evidence") or ():
             quote = ev.get("quote", "")
             computed_span, status = compute_span_from_quote(quote, body_canonical)
 
@@ -312,7 +527,12 @@ def enrich_evidence_with_spans(
     return topics
 
 
-def enforce_evidence_policy(topics: List[dict], text_canonical: str, threshold: float = 0.3) -> bool:
+def enforce_evidence_policy(
+    topics: List[dict],
+    text_canonical: str,
+    threshold: float = 0.3,
+    warnings: List[str] | None = None,
+) -> bool:
     """
     Returns False if >threshold fraction of evidence quotes are unverifiable.
     Use to trigger LLM retry.
@@ -321,21 +541,36 @@ def enforce_evidence_policy(topics: List[dict], text_canonical: str, threshold:
         topics: List of topic dicts.
         text_canonical: Canonical email text.
         threshold: Maximum acceptable failure rate (default 0.3 = 30%).
+        warnings: Precomputed verify_evidence_quotes(topics, text_canonical)
+                  result (e.g. ValidationResult.evidence_warnings); skips
+                  verifying the quotes again.
 
     Returns:
         True if evidence quality is acceptable, False if retry needed.
     """
-    total_evidence = sum(len(t.get("evidence", [])) for t in topics)
+    if warnings is not None and not warnings and threshold >= 0:
+        return True  # nothing unverifiable: no need to count the evidence
+
+    total_evidence = sum(len(t.get("evidence") or ()) for t in topics)
     if total_evidence == 0:
         return True
 
-    warnings = verify_evidence_quotes(topics, text_canonical)
-    failure_rate = len(warnings) / total_evidence
+    if warnings is None:
+        # Stop verifying once the outcome is decided. One past the floor is a
+        # safe stop: the float rounding of threshold * total_evidence moves
+        # the largest passing count by at most one, so any count above this
+        # bound fails the ratio test below.
+        max_failures = math.floor(threshold * total_evidence) + 1
+        warnings = verify_evidence_quotes(topics, text_canonical, max_failures=max_failures)
+        stopped_early = len(warnings) > max_failures
+    else:
+        stopped_early = False
 
-    if failure_rate > threshold:
+    if len(warnings) / total_evidence > threshold:
         logger.warning(
-            "Evidence policy failed: %.1f%% evidence unverifiable (threshold: %.1f%%)",
-            failure_rate * 100,
+            "Evidence policy failed: %s%.1f%% evidence unverifiable (threshold: %.1f%%)",
+            "at least " if stopped_early else "",
+            len(warnings) / total_evidence * 100,
             threshold * 100,
         )
         return False
@@ -347,6 +582,15 @@ def enforce_evidence_policy(topics: List[dict], text_canonical: str, threshold:
 # Deduplication & Normalization
 # ======================================================================
 
+def _clip01(value: float) -> float:
+    """Clamp a scalar confidence to [0.0, 1.0] (NaN passes through, as with np.clip)."""
+    if value < 0.0:
+        return 0.0
+    if value > 1.0:
+        return 1.0
+    return float(value)
+
+
 def deduplicate_and_normalize(triage_data: dict) -> dict:
     """
     Remove duplicate topics/keywords and clamp confidence values.
@@ -355,39 +599,24 @@ def deduplicate_and_normalize(triage_data: dict) -> dict:
     - Dedup keywords within each topic by candidateid
     - Clamp all confidence values to [0.0, 1.0]
     """
-    # Dedup topics
-    seen_labels: set = set()
-    unique_topics: List[dict] = []
-    for topic in triage_data.get("topics", []):
-        labelid = topic["labelid"]
-        if labelid not in seen_labels:
-            unique_topics.append(topic)
-            seen_labels.add(labelid)
-    triage_data["topics"] = unique_topics
-
-    # Dedup keywords within each topic
-    for topic in triage_data["topics"]:
-        seen_cids: set = set()
-        unique_kws: List[dict] = []
-        for kw in topic.get("keywordsintext", []):
-            cid = kw["candidateid"]
-            if cid not in seen_cids:
-                unique_kws.append(kw)
-                seen_cids.add(cid)
-        topic["keywordsintext"] = unique_kws
-
-    # Clamp confidence values
-    if "sentiment" in triage_data and "confidence" in triage_data["sentiment"]:
-        triage_data["sentiment"]["confidence"] = float(
-            np.clip(triage_data["sentiment"]["confidence"], 0.0, 1.0)
-        )
-
-    if "priority" in triage_data and "confidence" in triage_data["priority"]:
-        triage_data["priority"]["confidence"] = float(
-            np.clip(triage_data["priority"]["confidence"], 0.0, 1.0)
-        )
+    # Dedup topics (dicts keep insertion order; setdefault keeps the first value)
+    unique_topics: Dict[str, dict] = {}
+    for topic in triage_data.get("topics") or ():
+        unique_topics.setdefault(topic["labelid"], topic)
+    triage_data["topics"] = list(unique_topics.values())
 
+    # Dedup keywords and clamp confidence within each topic (one pass)
     for topic in triage_data["topics"]:
-        topic["confidence"] = float(np.clip(topic["confidence"], 0.0, 1.0))
+        unique_kws: Dict[str, dict] = {}
+        for kw in topic.get("keywordsintext") or ():
+            unique_kws.setdefault(kw["candidateid"], kw)
+        topic["keywordsintext"] = list(unique_kws.values())
+        topic["confidence"] = _clip01(topic["confidence"])
+
+    # Clamp sentiment/priority confidence values
+    for section in ("sentiment", "priority"):
+        values = triage_data.get(section)
+        if values is not None and "confidence" in values:
+            values["confidence"] = _clip01(values["confidence"])
 
     return triage_data
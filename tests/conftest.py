@@ -2,18 +2,18 @@
 Shared test fixtures for the post-processing test suite.
 """
 import json
+from types import MappingProxyType
 
 import pytest
 
 from src.models.email_document import EmailDocument
 from src.models.pipeline_version import PipelineVersion
 
-
 # ==========================================================================
 # Pipeline Version
 # ==========================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pipeline_version():
     return PipelineVersion(
         dictionaryversion=42,
@@ -86,8 +86,7 @@ def mock_document():
 # LLM Output (valid)
 # ==========================================================================
 
-@pytest.fixture
-def mock_llm_output(mock_candidates):
+def _build_mock_llm_output() -> dict:
     return {
         "dictionaryversion": 42,
         "sentiment": {
@@ -131,56 +130,67 @@ def mock_llm_output(mock_candidates):
 
 
 @pytest.fixture
-def mock_llm_output_json(mock_llm_output):
-    return json.dumps(mock_llm_output, ensure_ascii=False)
+def mock_llm_output():
+    # Function-scoped: the pipeline enriches evidence dicts in place
+    return _build_mock_llm_output()
+
+
+@pytest.fixture(scope="session")
+def mock_llm_output_json():
+    # Session-scoped: the JSON string is immutable, serialize it once
+    return json.dumps(_build_mock_llm_output(), ensure_ascii=False)
 
 
 # ==========================================================================
 # Regex & NER Lexicons
+#
+# Read-only fixtures below are built once per session and returned as
+# read-only views (MappingProxyType / tuple / frozenset), so a test cannot
+# leak mutations into another one.
 # ==========================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_regex_lexicon():
-    return {
-        "EMAIL": [
-            {
+    return MappingProxyType({
+        "EMAIL": (
+            MappingProxyType({
                 "regex_pattern": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
                 "label": "EMAIL",
-            },
-        ],
-        "CODICEFISCALE": [
-            {
+            }),
+        ),
+        "CODICEFISCALE": (
+            MappingProxyType({
                 "regex_pattern": r"\b[A-Z]{6}\d{2}[A-Z]\d{2}[A-Z]\d{3}[A-Z]\b",
                 "label": "CODICEFISCALE",
-            },
-        ],
-    }
+            }),
+        ),
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ner_lexicon():
-    return {
-        "AZIENDA": [
-            {
+    return MappingProxyType({
+        "AZIENDA": (
+            MappingProxyType({
                 "lemma": "ACME",
-                "surface_forms": ["ACME", "ACME S.p.A.", "ACME spa"],
-            },
-        ],
-    }
+                "surface_forms": ("ACME", "ACME S.p.A.", "ACME spa"),
+            }),
+        ),
+    })
 
 
 # ==========================================================================
 # Collision Index
 # ==========================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_collision_index():
     """Collision index with one ambiguous keyword."""
-    return {
-        "contratto": {"CONTRATTO", "FATTURAZIONE"},
-    }
+    return MappingProxyType({
+        "contratto": frozenset({"CONTRATTO", "FATTURAZIONE"}),
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_collision_index():
-    return {}
+    return MappingProxyType({})
@@ -0,0 +1,114 @@
+"""
+Integration tests — batch post-processing over a process pool.
+"""
+import json
+
+import pytest
+
+from src.models.email_document import EmailDocument
+from src.models.pipeline_version import PipelineVersion
+from src.postprocessing import batch
+from src.postprocessing.batch import BatchItem, postprocess_and_enrich_batch
+from src.postprocessing.pipeline import postprocess_and_enrich
+
+
+def _item(n: int) -> BatchItem:
+    body = f"Buongiorno, vorrei confermare i dati del contratto numero {n}."
+    doc = EmailDocument(
+        message_id=f"batch-{n:03d}@example.it",
+        from_raw="Mario Rossi <mario.rossi@example.it>",
+        subject="Richiesta contratto",
+        body=body,
+        body_canonical=body,
+    )
+    candidates = [
+        {
+            "candidateid": f"C{n:03d}",
+            "source": "body",
+            "term": "contratto",
+            "lemma": "contratto",
+            "count": 1,
+            "embeddingscore": 0.8,
+            "score": 0.7,
+        },
+    ]
+    llm_output = json.dumps({
+        "dictionaryversion": 1,
+        "sentiment": {"value": "neutral", "confidence": 0.7},
+        "priority": {"value": "low", "confidence": 0.6, "signals": []},
+        "topics": [
+            {
+                "labelid": "CONTRATTO",
+                "confidence": 0.9,
+                "keywordsintext": [{"candidateid": f"C{n:03d}"}],
+                "evidence": [{"quote": "confermare i dati del contratto"}],
+            },
+        ],
+    })
+    return BatchItem(llm_output, candidates, doc)
+
+
+def _strip_volatile(result: dict) -> dict:
+    result["processing_metadata"].pop("postprocessing_duration_ms", None)
+    for obs in result["observations"]:
+        obs.pop("obs_id", None)
+        obs.pop("observed_at", None)
+    return result
+
+
+class _FailingScorer:
+    def score(self, *args, **kwargs):
+        raise RuntimeError("scorer down")
+
+
+class TestPostprocessAndEnrichBatch:
+    """Tests for postprocess_and_enrich_batch."""
+
+    @pytest.fixture
+    def version(self):
+        return PipelineVersion(dictionaryversion=1, modelversion="test")
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_sequential_results(self, version, workers):
+        items = [_item(n) for n in range(4)]
+        expected = [
+            _strip_volatile(postprocess_and_enrich(*_item(n), pipeline_version=version))
+            for n in range(4)
+        ]
+
+        results = sorted(
+            postprocess_and_enrich_batch(items, version, workers=workers),
+            key=lambda r: r.index,
+        )
+
+        assert [r.index for r in results] == [0, 1, 2, 3]
+        for res, exp in zip(results, expected):
+            assert res.error is None
+            assert res.message_id == exp["message_id"]
+            assert _strip_volatile(res.result) == exp
+
+    def test_invalid_item_reported_not_raised(self, version):
+        bad = _item(1)._replace(llm_output_raw="INVALID JSON {{{")
+        results = sorted(
+            postprocess_and_enrich_batch([_item(0), bad], version, workers=1),
+            key=lambda r: r.index,
+        )
+
+        assert results[0].error is None
+        assert results[1].result is None
+        assert "LLM output validation failed" in results[1].error
+
+    def test_unexpected_exception_reported_not_raised(self, version):
+        results = list(postprocess_and_enrich_batch(
+            [_item(0)], version, workers=1, scorer=_FailingScorer(),
+        ))
+
+        assert results[0].result is None
+        assert results[0].error == "RuntimeError: scorer down"
+
+    def test_in_process_run_leaves_worker_kwargs_untouched(self, version):
+        list(postprocess_and_enrich_batch([_item(0)], version, workers=1))
+        assert batch._WORKER_KWARGS == {}
+
+    def test_empty_batch(self, version):
+        assert list(postprocess_and_enrich_batch([], version)) == []
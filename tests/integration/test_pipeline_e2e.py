@@ -9,6 +9,37 @@ from src.models.email_document import EmailDocument
 from src.models.pipeline_version import PipelineVersion
 from src.postprocessing.pipeline import postprocess_and_enrich
 
+# Serialized once at import: the string is immutable and shared by every test
+_LLM_OUTPUT_JSON = json.dumps({
+    "dictionaryversion": 42,
+    "sentiment": {"value": "neutral", "confidence": 0.7},
+    "priority": {"value": "medium", "confidence": 0.6, "signals": ["scadenza"]},
+    "topics": [
+        {
+            "labelid": "CONTRATTO",
+            "confidence": 0.9,
+            "keywordsintext": [{"candidateid": "C001"}],
+            "evidence": [
+                {
+                    "quote": "confermare i dati del contratto",
+                    "span": [22, 53],
+                },
+            ],
+        },
+        {
+            "labelid": "FATTURAZIONE",
+            "confidence": 0.7,
+            "keywordsintext": [{"candidateid": "C002"}],
+            "evidence": [
+                {
+                    "quote": "fattura da saldare",
+                    "span": [62, 80],
+                },
+            ],
+        },
+    ],
+}, ensure_ascii=False)
+
 
 class TestPipelineE2E:
     """End-to-end integration tests for the full pipeline."""
@@ -50,35 +81,7 @@ class TestPipelineE2E:
             },
         ]
 
-        llm_output = json.dumps({
-            "dictionaryversion": 42,
-            "sentiment": {"value": "neutral", "confidence": 0.7},
-            "priority": {"value": "medium", "confidence": 0.6, "signals": ["scadenza"]},
-            "topics": [
-                {
-                    "labelid": "CONTRATTO",
-                    "confidence": 0.9,
-                    "keywordsintext": [{"candidateid": "C001"}],
-                    "evidence": [
-                        {
-                            "quote": "confermare i dati del contratto",
-                            "span": [22, 53],
-                        },
-                    ],
-                },
-                {
-                    "labelid": "FATTURAZIONE",
-                    "confidence": 0.7,
-                    "keywordsintext": [{"candidateid": "C002"}],
-                    "evidence": [
-                        {
-                            "quote": "fattura da saldare",
-                            "span": [62, 80],
-                        },
-                    ],
-                },
-            ],
-        }, ensure_ascii=False)
+        llm_output = _LLM_OUTPUT_JSON
 
         version = PipelineVersion(dictionaryversion=42, modelversion="gpt-4o-test")
 
@@ -0,0 +1,57 @@
+"""
+Unit tests for CandidateCatalog.
+"""
+from src.models.candidate_catalog import CandidateCatalog
+from src.postprocessing.keyword_resolver import resolve_keywords_from_catalog
+
+
+class TestCandidateCatalog:
+    """Tests for the lazily indexed candidate catalog."""
+
+    def test_by_id_index(self, mock_candidates):
+        catalog = CandidateCatalog(mock_candidates)
+        assert set(catalog.by_id) == {"ABC123", "DEF456", "GHI789", "JKL012"}
+        assert catalog.by_id["ABC123"] is mock_candidates[0]
+
+    def test_by_id_built_once(self, mock_candidates):
+        catalog = CandidateCatalog(mock_candidates)
+        assert catalog.by_id is catalog.by_id
+
+    def test_of_wraps_list_and_passes_catalog_through(self, mock_candidates):
+        catalog = CandidateCatalog.of(mock_candidates)
+        assert catalog.candidates is mock_candidates
+        assert CandidateCatalog.of(catalog) is catalog
+
+    def test_iter_and_len(self, mock_candidates):
+        catalog = CandidateCatalog(mock_candidates)
+        assert len(catalog) == 4
+        assert list(catalog) == mock_candidates
+
+    def test_accepted_by_resolver(self, mock_candidates):
+        triage_data = {
+            "topics": [
+                {"labelid": "CONTRATTO", "keywordsintext": [{"candidateid": "DEF456"}]},
+            ],
+        }
+        result = resolve_keywords_from_catalog(triage_data, CandidateCatalog(mock_candidates))
+        assert result["topics"][0]["keywordsintext"][0]["term"] == "fattura"
+
+    def test_by_id_fields_slim(self, mock_candidates):
+        fields = CandidateCatalog(mock_candidates).by_id_fields["ABC123"]
+        assert set(fields) == {"lemma", "term", "count", "source", "embeddingscore"}
+        assert fields["term"] == mock_candidates[0]["term"]
+
+    def test_resolver_updates_keywords_in_place(self, mock_candidates):
+        kw = {"candidateid": "ABC123"}
+        triage_data = {"topics": [{"labelid": "CONTRATTO", "keywordsintext": [kw]}]}
+        result = resolve_keywords_from_catalog(triage_data, mock_candidates)
+        assert result["topics"][0]["keywordsintext"][0] is kw
+        assert kw["lemma"] == "contratto"
+
+    def test_resolved_candidateid_interned(self, mock_candidates):
+        catalog = CandidateCatalog(mock_candidates)
+        cid = "".join(["ABC", "123"])  # fresh, non-interned string
+        triage_data = {"topics": [{"labelid": "CONTRATTO", "keywordsintext": [{"candidateid": cid}]}]}
+        resolve_keywords_from_catalog(triage_data, catalog)
+        resolved = triage_data["topics"][0]["keywordsintext"][0]["candidateid"]
+        assert any(resolved is key for key in catalog.by_id)
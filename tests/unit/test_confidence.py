@@ -7,6 +7,7 @@ from src.postprocessing.confidence import (
     adjust_all_topic_confidences,
     build_collision_index,
     compute_topic_confidence_adjusted,
+    compute_topic_confidence_from_map,
 )
 
 
@@ -82,6 +83,19 @@ class TestComputeTopicConfidenceAdjusted:
 
         assert conf_2 > conf_1
 
+    def test_prebuilt_map_matches_wrapper(self, mock_candidates, mock_collision_index):
+        topic = {
+            "labelid": "CONTRATTO",
+            "confidence": 0.8,
+            "keywordsintext": [{"candidateid": "ABC123"}, {"candidateid": "GHI789"}],
+            "evidence": [{"quote": "ev1"}],
+        }
+        cand_map = {c["candidateid"]: c for c in mock_candidates}
+
+        assert compute_topic_confidence_from_map(
+            topic, cand_map, mock_collision_index, 0.8
+        ) == compute_topic_confidence_adjusted(topic, mock_candidates, mock_collision_index, 0.8)
+
 
 class TestAdjustAllTopicConfidences:
     """Tests for adjust_all_topic_confidences (★FIX #2★ naming)."""
@@ -138,6 +152,38 @@ class TestAdjustAllTopicConfidences:
             assert "confidence_adjusted" in topic
             assert 0.0 <= topic["confidence_adjusted"] <= 1.0
 
+    def test_batch_matches_per_topic_formula(self, mock_candidates, mock_collision_index):
+        topics = [
+            {
+                "labelid": "CONTRATTO",
+                "confidence": 0.9,
+                "keywordsintext": [{"candidateid": "ABC123"}, {"candidateid": "DEF456"}],
+                "evidence": [{"quote": "ev1"}, {"quote": "ev2"}, {"quote": "ev3"}],
+            },
+            {
+                "labelid": "FATTURAZIONE",
+                "confidence": 0.4,
+                "keywordsintext": [],
+                "evidence": [{"quote": "ev"}],
+            },
+            {
+                "labelid": "RECLAMO",
+                "confidence": 0.6,
+                "keywordsintext": [{"candidateid": "UNKNOWN"}],
+                "evidence": [],
+            },
+        ]
+        expected = [
+            compute_topic_confidence_adjusted(t, mock_candidates, mock_collision_index, t["confidence"])
+            for t in topics
+        ]
+
+        result = adjust_all_topic_confidences({"topics": topics}, mock_candidates, mock_collision_index)
+
+        for topic, exp in zip(result["topics"], expected):
+            assert topic["confidence_adjusted"] == pytest.approx(exp)
+            assert isinstance(topic["confidence_adjusted"], float)
+
 
 class TestBuildCollisionIndex:
     """Tests for collision index builder (placeholder)."""
@@ -0,0 +1,60 @@
+"""
+Unit tests for the precompiled patterns in src.config.constants.
+"""
+import re
+
+import pytest
+
+from src.config.constants import (
+    BLACKLIST_COMPILED,
+    BLACKLIST_PATTERNS,
+    BLACKLIST_UNION,
+    STOPWORDS_IT,
+    STOPWORDS_RE,
+)
+
+_TERMS = [
+    "re: contratto", "RE: contratto", "Re:fattura", "fw: offerta",
+    "fwd: offerta", "FWD:offerta", "fwd offerta", "reclamo",
+    "12345", "12a", "", "a", "X", "ab", "contratto", "è",
+]
+
+
+class TestBlacklistPatterns:
+    """BLACKLIST_UNION must decide exactly as the per-pattern list."""
+
+    @pytest.mark.parametrize("term", _TERMS)
+    def test_union_matches_per_pattern_list(self, term):
+        expected = any(p.search(term) for p in BLACKLIST_COMPILED)
+        assert bool(BLACKLIST_UNION.search(term)) is expected
+
+    @pytest.mark.parametrize("term", [t.lower() for t in _TERMS])
+    def test_union_matches_raw_patterns_on_lowercase_terms(self, term):
+        expected = any(re.search(p, term) for p in BLACKLIST_PATTERNS)
+        assert bool(BLACKLIST_UNION.search(term)) is expected
+
+    @pytest.mark.parametrize("term", ["X", "RE: contratto", "FWD: offerta"])
+    def test_union_is_case_insensitive(self, term):
+        # Intended: uppercase single letters and RE:/FWD: prefixes are
+        # blacklisted too, which the raw case-sensitive patterns miss
+        assert not any(re.search(p, term) for p in BLACKLIST_PATTERNS)
+        assert BLACKLIST_UNION.search(term)
+
+
+class TestStopwordsRegex:
+    """STOPWORDS_RE must match whole-word stopwords only."""
+
+    def test_every_stopword_matches_as_whole_word(self):
+        for word in STOPWORDS_IT:
+            assert STOPWORDS_RE.fullmatch(word), word
+            assert STOPWORDS_RE.search(f"xyz {word}, xyz"), word
+
+    def test_matches_are_exactly_the_stopword_tokens(self):
+        text = "Buongiorno, il contratto della ditta è scaduto: perché? Grazie"
+        found = [m.group(0) for m in STOPWORDS_RE.finditer(text)]
+        expected = [tok for tok in re.findall(r"\w+", text) if tok.lower() in STOPWORDS_IT]
+        assert found == expected == ["Buongiorno", "il", "della", "è", "perché", "Grazie"]
+
+    @pytest.mark.parametrize("text", ["filo", "contratto", "dellaria", "unico", "perchénon", "salutista"])
+    def test_no_match_inside_words(self, text):
+        assert STOPWORDS_RE.search(text) is None
@@ -3,6 +3,7 @@ Unit tests for customer status computation.
 """
 import pytest
 
+from src.config.constants import EXISTING_CUSTOMER_SIGNALS
 from src.postprocessing.customer_status import (
     compute_customer_status,
     crm_lookup_mock,
@@ -83,6 +84,15 @@ class TestComputeCustomerStatus:
         assert result["value"] == "existing"
         assert result["source"] == "text_signal"
 
+    @pytest.mark.parametrize("signal", EXISTING_CUSTOMER_SIGNALS)
+    def test_every_signal_detected(self, signal):
+        result = compute_customer_status(
+            "nuovo@unknown.com",
+            f"Buongiorno, {signal} e vorrei assistenza.",
+            crm_lookup_mock,
+        )
+        assert result["source"] == "text_signal"
+
 
 class TestCRMLookupMock:
     """Tests for the mock CRM lookup function."""
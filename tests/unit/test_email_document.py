@@ -0,0 +1,57 @@
+"""
+Unit tests for EmailDocument.
+"""
+import pytest
+
+from src.models.email_document import EmailDocument
+
+
+def _doc(from_raw: str) -> EmailDocument:
+    return EmailDocument(
+        message_id="msg-001",
+        from_raw=from_raw,
+        subject="Test",
+        body="Corpo",
+        body_canonical="Corpo",
+    )
+
+
+class TestFromEmail:
+    """Tests for the from_email address extraction."""
+
+    @pytest.mark.parametrize(
+        "from_raw, expected",
+        [
+            ("Mario Rossi <mario.rossi@example.it>", "mario.rossi@example.it"),
+            ("< cliente@acme.com >", "cliente@acme.com"),
+            ("  cliente@acme.com  ", "cliente@acme.com"),
+            ("Mario Rossi <mario.rossi@example.it", "Mario Rossi <mario.rossi@example.it"),
+        ],
+    )
+    def test_extracts_bare_address(self, from_raw, expected):
+        assert _doc(from_raw).from_email == expected
+
+    def test_parsed_field_not_in_equality_or_repr(self):
+        doc = _doc("Mario Rossi <mario.rossi@example.it>")
+        assert doc == _doc("Mario Rossi <mario.rossi@example.it>")
+        assert "_from_email" not in repr(doc)
+
+
+class TestBodyCanonicalLower:
+    """Tests for the cached lowercased body."""
+
+    def test_lowercases_once(self):
+        doc = _doc("a@b.it")
+        assert doc.body_canonical_lower == "corpo"
+        assert doc.body_canonical_lower is doc.body_canonical_lower
+
+
+class TestBodyCanonicalSha256:
+    """Tests for the cached body hash."""
+
+    def test_matches_hashlib_and_cached(self):
+        import hashlib
+
+        doc = _doc("a@b.it")
+        assert doc.body_canonical_sha256 == hashlib.sha256(doc.body_canonical.encode()).hexdigest()
+        assert doc.body_canonical_sha256 is doc.body_canonical_sha256
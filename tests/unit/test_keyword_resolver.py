@@ -85,3 +85,22 @@ class TestKeywordResolution:
         }
         result = resolve_keywords_from_catalog(triage_data, candidates)
         assert result["topics"][0]["keywordsintext"][0]["embeddingscore"] == 0.0
+
+    def test_count_mismatches_logged_once(self, mock_candidates, caplog):
+        triage_data = {
+            "topics": [
+                {
+                    "labelid": "CONTRATTO",
+                    "keywordsintext": [
+                        {"candidateid": "ABC123", "count": 99},
+                        {"candidateid": "DEF456", "count": 7},
+                    ],
+                },
+            ],
+        }
+        with caplog.at_level("WARNING", logger="src.postprocessing.keyword_resolver"):
+            result = resolve_keywords_from_catalog(triage_data, mock_candidates)
+
+        assert [kw["count"] for kw in result["topics"][0]["keywordsintext"]] == [3, 2]
+        assert len(caplog.records) == 1
+        assert "2 keyword(s)" in caplog.records[0].getMessage()
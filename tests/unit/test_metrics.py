@@ -23,6 +23,7 @@ class TestMetricsAvailability:
             "record_barrier_block",
             "update_redis_key_count",
             "timed_layer",
+            "observe_layer_latency",
             "VALIDATION_ERRORS",
             "SPAN_STATUS",
             "LAYER_LATENCY",
@@ -60,7 +61,16 @@ class TestMetricHelpers:
 
     def test_timed_layer_does_not_suppress_exceptions(self):
         import pytest
+
         from src.postprocessing.metrics import timed_layer
         with pytest.raises(ValueError, match="test error"):
             with timed_layer("test_layer"):
                 raise ValueError("test error")
+
+    def test_observe_layer_latency(self):
+        from src.postprocessing.metrics import observe_layer_latency
+        observe_layer_latency("postprocessing", 0.12)
+
+    def test_labelled_children_memoized(self):
+        from src.postprocessing.metrics import SPAN_STATUS, _child
+        assert _child(SPAN_STATUS, "exact_match") is _child(SPAN_STATUS, "exact_match")
@@ -1,6 +1,8 @@
 """
 Unit tests for observation storage.
 """
+import uuid
+
 import pytest
 
 from src.dictionary.observations import build_observations
@@ -71,6 +73,20 @@ class TestBuildObservations:
         observations = build_observations("msg-001", topics, mock_candidates, 42)
         obs_ids = [o["obs_id"] for o in observations]
         assert len(set(obs_ids)) == len(obs_ids), "obs_ids must be unique"
+        assert all(uuid.UUID(oid).version == 4 for oid in obs_ids)
+
+    def test_shared_observed_at(self, mock_candidates):
+        topics = [
+            {
+                "labelid": "CONTRATTO",
+                "keywordsintext": [
+                    {"candidateid": "ABC123"},
+                    {"candidateid": "DEF456"},
+                ],
+            },
+        ]
+        observations = build_observations("msg-001", topics, mock_candidates, 42)
+        assert len({o["observed_at"] for o in observations}) == 1
 
     def test_multiple_topics_multiple_observations(self, mock_candidates):
         topics = [
@@ -64,6 +64,26 @@ class TestNormalizeTopicsKeywords:
         result = normalize_topics_keywords(topics)
         assert result[0]["keywords"][0]["embeddingscore"] == 0.0
 
+    def test_keywords_projected_to_schema_fields(self):
+        kw = {
+            "candidateid": "ABC",
+            "lemma": "l",
+            "term": "t",
+            "count": 1,
+            "source": "body",
+            "embeddingscore": 0.4,
+            "internal_note": "dropped",
+        }
+        result = normalize_topics_keywords([{"labelid": "CONTRATTO", "keywordsintext": [kw]}])
+        assert set(result[0]["keywords"][0]) == {
+            "candidateid", "term", "lemma", "count", "source", "embeddingscore",
+        }
+        assert result[0]["keywordsintext"][0] is kw
+
+    def test_missing_keywordsintext(self):
+        result = normalize_topics_keywords([{"labelid": "CONTRATTO"}])
+        assert result[0]["keywords"] == []
+
 
 class TestBuildTriageOutputSchema:
     """Tests for the complete triage output builder."""
@@ -128,3 +148,22 @@ class TestBuildTriageOutputSchema:
         topic = result["topics"][0]
         assert "confidence_llm" in topic
         assert "confidence_adjusted" in topic
+
+    def test_keywords_match_normalize_topics_keywords(self):
+        kw = {
+            "candidateid": "ABC",
+            "lemma": "contratto",
+            "term": "contratto",
+            "count": 1,
+            "source": "body",
+            "internal_note": "dropped",
+        }
+        triage = {"topics": [{"labelid": "CONTRATTO", "keywordsintext": [kw]}]}
+        expected = normalize_topics_keywords([{"labelid": "CONTRATTO", "keywordsintext": [kw]}])
+
+        result = build_triage_output_schema(triage, {}, {})
+
+        assert result["topics"][0]["keywords"] == expected[0]["keywords"]
+        assert list(result["topics"][0]["keywords"][0]) == [
+            "candidateid", "term", "lemma", "count", "source", "embeddingscore",
+        ]
@@ -3,7 +3,8 @@ Unit tests for priority scoring.
 """
 import pytest
 
-from src.postprocessing.priority_scorer import PriorityScorer
+from src.postprocessing import priority_scorer as priority_scorer_module
+from src.postprocessing.priority_scorer import PriorityScorer, _count_priority_terms
 
 
 class TestPriorityScorer:
@@ -57,6 +58,37 @@ class TestPriorityScorer:
         )
         assert "deadline_mentioned" in result["signals"]
 
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "Vi prego di rispondere ENTRO IL 3 aprile.",
+            "La scadenza prevista è il 2026-03-31.",
+            "Serve una risposta entro 10 giorni.",
+        ],
+    )
+    def test_deadline_patterns(self, scorer, body):
+        result = scorer.score(
+            subject="Info",
+            body_canonical=body,
+            sentiment_value="neutral",
+            customer_value="existing",
+        )
+        assert "deadline_mentioned" in result["signals"]
+
+    def test_deadline_signals_mixed_case(self, scorer):
+        assert scorer._extract_deadline_signals("Rispondere Entro Il 3 aprile") == 2
+        assert scorer._extract_deadline_signals("SCADENZA al 2026-03-31") == 2
+        assert scorer._extract_deadline_signals("Entro 10 Giorni") == 2
+
+    def test_no_deadline(self, scorer):
+        result = scorer.score(
+            subject="Info",
+            body_canonical="Nessuna data indicata, entro breve.",
+            sentiment_value="neutral",
+            customer_value="existing",
+        )
+        assert "deadline_mentioned" not in result["signals"]
+
     def test_vip_customer_boost(self, scorer):
         result_no_vip = scorer.score(
             subject="Info",
@@ -106,6 +138,16 @@ class TestPriorityScorer:
         # All signals should be strings
         assert all(isinstance(s, str) for s in signals)
 
+    def test_terms_counted_once_per_term(self, scorer):
+        result = scorer.score(
+            subject="urgente",
+            body_canonical="urgente, davvero urgente. Problema e ancora problema.",
+            sentiment_value="neutral",
+            customer_value="existing",
+        )
+        assert "urgent_keywords:1" in result["signals"]
+        assert "high_keywords:1" in result["signals"]
+
     def test_bucketing_boundaries(self, scorer):
         """Verify bucketing thresholds are correct."""
         # Use multiple distinct urgent terms to accumulate score
@@ -119,3 +161,54 @@ class TestPriorityScorer:
         )
         assert result["value"] == "urgent"
         assert result["rawscore"] >= 7.0
+
+    def test_precomputed_text_lower_matches(self, scorer):
+        subject, body = "URGENTE: Scadenza", "Rispondere ENTRO IL 3 aprile, problema grave."
+        expected = scorer.score(subject, body, "negative", "new")
+        result = scorer.score(
+            subject, body, "negative", "new",
+            text_lower=f"{subject} {body}".lower(),
+        )
+        assert result == expected
+
+    def test_short_circuit_keeps_urgent_bucket(self, scorer):
+        kwargs = dict(
+            subject="urgente bloccante diffida",
+            body_canonical="Rispondere entro il 3 aprile.",
+            sentiment_value="negative",
+            customer_value="new",
+        )
+        full = scorer.score(**kwargs)
+        fast = scorer.score(**kwargs, exhaustive_signals=False)
+
+        assert fast["value"] == full["value"] == "urgent"
+        assert "deadline_mentioned" in full["signals"]
+        assert "deadline_mentioned" not in fast["signals"]
+        assert fast["rawscore"] <= full["rawscore"]
+
+    def test_short_circuit_only_above_threshold(self, scorer):
+        kwargs = dict(
+            subject="Info",
+            body_canonical="Serve una risposta entro 10 giorni.",
+            sentiment_value="neutral",
+            customer_value="new",
+        )
+        assert scorer.score(**kwargs, exhaustive_signals=False) == scorer.score(**kwargs)
+
+
+class TestCountPriorityTerms:
+    """The automaton and the substring fallback must agree."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "urgente, davvero urgente. problema e ancora problema.",
+            "intervento urgentemente richiesto: il servizio non funziona",
+            "sla scaduto, guasto critico e fermo macchina; serve assistenza e supporto",
+        ],
+    )
+    def test_fallback_matches_automaton(self, monkeypatch, text):
+        expected = _count_priority_terms(text)
+        monkeypatch.setattr(priority_scorer_module, "_TERM_AUTOMATON", None)
+        assert _count_priority_terms(text) == expected
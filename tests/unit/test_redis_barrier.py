@@ -4,25 +4,30 @@ Unit tests for src.postprocessing.redis_barrier.
 Covers:
 - process_layer_with_barrier() happy path
 - Validation failure blocks propagation (write barrier semantics)
-- Convenience getters: get_raw_payload / get_normalized_payload
+- Convenience getters: get_raw_payload / get_normalized_payload / get_all_layer_payloads
 - NullRedisClient drop-in
 """
 from __future__ import annotations
 
+import asyncio
 import json
 
+import numpy as np
 import pytest
 
 from src.postprocessing.redis_barrier import (
     NullRedisClient,
     ValidationOutcome,
     WriteBarrierValidationError,
+    aprocess_layer_with_barrier,
+    build_async_redis_client,
+    flush_barrier_writes,
+    get_all_layer_payloads,
     get_normalized_payload,
     get_raw_payload,
     process_layer_with_barrier,
 )
 
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -32,6 +37,7 @@ class _InMemoryRedis:
 
     def __init__(self):
         self._store: dict = {}
+        self.expiries: dict = {}
 
     def set(self, key: str, value: str, **kwargs) -> None:  # noqa: ARG002
         self._store[key] = value
@@ -39,6 +45,24 @@ class _InMemoryRedis:
     def get(self, key: str) -> str | None:
         return self._store.get(key)
 
+    def mget(self, keys: list[str]) -> list[str | None]:
+        return [self._store.get(k) for k in keys]
+
+    def hset(self, name: str, mapping: dict) -> int:
+        self._store.setdefault(name, {}).update(mapping)
+        return len(mapping)
+
+    def hget(self, name: str, key: str) -> str | None:
+        return self._store.get(name, {}).get(key)
+
+    def hmget(self, name: str, keys: list[str]) -> list[str | None]:
+        fields = self._store.get(name, {})
+        return [fields.get(k) for k in keys]
+
+    def expire(self, name: str, time: int) -> bool:
+        self.expiries[name] = time
+        return name in self._store
+
     def exists(self, *keys: str) -> int:
         return sum(1 for k in keys if k in self._store)
 
@@ -54,6 +78,42 @@ class _InMemoryRedis:
         return [k for k in self._store if k.startswith(prefix)]
 
 
+class _PipelinedRedis(_InMemoryRedis):
+    """In-memory stub with a pipeline() that counts round-trips."""
+
+    def __init__(self):
+        super().__init__()
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True):  # noqa: ARG002
+        return _StubPipeline(self)
+
+
+class _StubPipeline:
+    def __init__(self, client: _PipelinedRedis):
+        self._client = client
+        self._queued: list = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._queued.clear()
+
+    def set(self, key: str, value: str, **kwargs) -> None:
+        self._queued.append(("set", (key, value), kwargs))
+
+    def hset(self, name: str, mapping: dict) -> None:
+        self._queued.append(("hset", (name,), {"mapping": mapping}))
+
+    def expire(self, name: str, time: int) -> None:
+        self._queued.append(("expire", (name, time), {}))
+
+    def execute(self) -> list:
+        self._client.round_trips += 1
+        return [getattr(self._client, cmd)(*args, **kwargs) for cmd, args, kwargs in self._queued]
+
+
 @pytest.fixture
 def redis_stub():
     return _InMemoryRedis()
@@ -216,6 +276,57 @@ class TestWriteBarrierValidationFailure:
         assert "test: mandatory field missing" in err_payload["errors"]
 
 
+class TestWriteBarrierPipelining:
+    def test_success_single_round_trip(self):
+        client = _PipelinedRedis()
+        process_layer_with_barrier(
+            input_data={"x": 1},
+            layer_fn=_identity_layer,
+            validator_fn=_passing_validator,
+            redis_client=client,
+            run_id="run-pipe-001",
+            message_id="test@example.it",
+            layer_name="postprocessing",
+        )
+        assert client.round_trips == 1
+        assert len(client.keys_matching("run:run-pipe-001:")) == 2  # raw + normalized
+
+    def test_failure_single_round_trip(self):
+        client = _PipelinedRedis()
+        with pytest.raises(WriteBarrierValidationError):
+            process_layer_with_barrier(
+                input_data={"x": 1},
+                layer_fn=_identity_layer,
+                validator_fn=_failing_validator,
+                redis_client=client,
+                run_id="run-pipe-002",
+                message_id="test@example.it",
+                layer_name="postprocessing",
+            )
+        assert client.round_trips == 1
+        assert sorted(k.rsplit(":", 1)[1] for k in client.keys_matching("run:run-pipe-002:")) == [
+            "error", "raw",
+        ]
+
+    def test_raw_persisted_when_validator_raises(self, redis_stub):
+        def crashing_validator(output: dict) -> ValidationOutcome:  # noqa: ARG001
+            raise RuntimeError("validator bug")
+
+        with pytest.raises(RuntimeError):
+            process_layer_with_barrier(
+                input_data={"x": 1},
+                layer_fn=_identity_layer,
+                validator_fn=crashing_validator,
+                redis_client=redis_stub,
+                run_id="run-pipe-003",
+                message_id="test@example.it",
+                layer_name="postprocessing",
+            )
+        assert redis_stub.keys_matching("run:run-pipe-003:") == [
+            "run:run-pipe-003:msg:test@example.it:layer:postprocessing:raw",
+        ]
+
+
 # ---------------------------------------------------------------------------
 # Convenience getters
 # ---------------------------------------------------------------------------
@@ -252,6 +363,41 @@ class TestWriteBarrierGetters:
         result = get_raw_payload(redis_stub, "nonexistent", "x@y.com", "layer_x")
         assert result is None
 
+    def test_get_all_layer_payloads(self, redis_stub):
+        for layer in ("candidate_generation", "postprocessing"):
+            process_layer_with_barrier(
+                input_data={"layer": layer},
+                layer_fn=_identity_layer,
+                validator_fn=_passing_validator,
+                redis_client=redis_stub,
+                run_id="run-get-003",
+                message_id="<m@example.it>",
+                layer_name=layer,
+            )
+        with pytest.raises(WriteBarrierValidationError):
+            process_layer_with_barrier(
+                input_data={"layer": "llm_classification"},
+                layer_fn=_identity_layer,
+                validator_fn=_failing_validator,
+                redis_client=redis_stub,
+                run_id="run-get-003",
+                message_id="<m@example.it>",
+                layer_name="llm_classification",
+            )
+
+        payloads = get_all_layer_payloads(
+            redis_stub,
+            "run-get-003",
+            "<m@example.it>",
+            ["candidate_generation", "llm_classification", "postprocessing", "missing"],
+        )
+
+        assert payloads["candidate_generation"]["raw"]["layer"] == "candidate_generation"
+        assert payloads["postprocessing"]["normalized"]["layer"] == "postprocessing"
+        assert payloads["llm_classification"]["raw"] is not None
+        assert payloads["llm_classification"]["normalized"] is None
+        assert payloads["missing"] == {"raw": None, "normalized": None}
+
 
 # ---------------------------------------------------------------------------
 # NullRedisClient
@@ -266,6 +412,10 @@ class TestNullRedisClient:
         client.set("key", "value")
         assert client.get("key") is None
 
+    def test_mget_returns_nones(self):
+        client = NullRedisClient()
+        assert client.mget(["a", "b"]) == [None, None]
+
     def test_exists_always_returns_zero(self):
         assert NullRedisClient().exists("a", "b") == 0
 
@@ -281,3 +431,283 @@ class TestNullRedisClient:
             layer_name="test",
         )
         assert result["ok"] is True
+
+
+# ---------------------------------------------------------------------------
+# Payload serialization
+# ---------------------------------------------------------------------------
+
+class TestPayloadSerialization:
+    def test_roundtrip_matches_stdlib(self):
+        from datetime import datetime
+
+        from src.postprocessing.redis_barrier import _dumps, _loads
+
+        payload = {"when": datetime(2026, 3, 1, 12, 30), 1: "int key", "txt": "già"}
+        assert _loads(_dumps(payload)) == json.loads(json.dumps(payload, default=str))
+
+    def test_dumps_returns_str(self):
+        from src.postprocessing.redis_barrier import _dumps
+
+        assert isinstance(_dumps({"a": [1, 2]}), str)
+
+    def test_numpy_scalars_round_trip_as_numbers(self, redis_stub):
+        def numpy_layer(input_data: dict) -> dict:  # noqa: ARG001
+            return {"confidence": np.float64(0.5), "count": np.int64(3)}
+
+        process_layer_with_barrier(
+            input_data={},
+            layer_fn=numpy_layer,
+            validator_fn=_passing_validator,
+            redis_client=redis_stub,
+            run_id="run-np-001",
+            message_id="test@example.it",
+            layer_name="postprocessing",
+        )
+        raw = get_raw_payload(redis_stub, "run-np-001", "test@example.it", "postprocessing")
+        assert raw["confidence"] == 0.5
+        assert isinstance(raw["confidence"], float)
+        assert raw["count"] == 3
+
+    def test_orjson_output_kept_for_nulls(self):
+        from src.postprocessing.redis_barrier import ORJSON_AVAILABLE, _dumps
+
+        if not ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        payload = {"quote": "richiesta di annullamento", "span_llm": None}
+        assert _dumps(payload) == '{"quote":"richiesta di annullamento","span_llm":null}'
+
+    def test_non_finite_floats_stored_as_null(self):
+        from src.postprocessing.redis_barrier import ORJSON_AVAILABLE, _dumps, _loads
+
+        if not ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        assert _loads(_dumps({"ratio": float("nan"), "max": float("inf")})) == {"ratio": None, "max": None}
+
+
+class TestSafeMid:
+    @pytest.mark.parametrize(
+        "message_id, expected",
+        [
+            ("<abcd1234@example.it>", "abcd1234@example.it"),
+            ("id with spaces/and/slashes", "id_with_spaces_and_slashes"),
+            ("plain@example.it", "plain@example.it"),
+        ],
+    )
+    def test_sanitises(self, message_id, expected):
+        from src.postprocessing.redis_barrier import _safe_mid
+
+        assert _safe_mid(message_id) == expected
+
+
+class TestIdentityNormalizer:
+    def test_normalized_equals_raw_without_normalizer(self, redis_stub):
+        process_layer_with_barrier(
+            input_data={"x": 1},
+            layer_fn=_identity_layer,
+            validator_fn=_passing_validator,
+            redis_client=redis_stub,
+            run_id="run-id-001",
+            message_id="test@example.it",
+            layer_name="postprocessing",
+        )
+        prefix = "run:run-id-001:msg:test@example.it:layer:postprocessing"
+        assert redis_stub.get(f"{prefix}:normalized") == redis_stub.get(f"{prefix}:raw")
+
+    def test_validator_in_place_fix_reaches_normalized(self, redis_stub):
+        def fixing_validator(output: dict) -> ValidationOutcome:
+            output["fixed"] = True
+            return ValidationOutcome(valid=True)
+
+        process_layer_with_barrier(
+            input_data={"x": 1},
+            layer_fn=_identity_layer,
+            validator_fn=fixing_validator,
+            redis_client=redis_stub,
+            run_id="run-id-002",
+            message_id="test@example.it",
+            layer_name="postprocessing",
+        )
+        args = (redis_stub, "run-id-002", "test@example.it", "postprocessing")
+        assert "fixed" not in get_raw_payload(*args)
+        assert get_normalized_payload(*args)["fixed"] is True
+
+    @pytest.mark.parametrize("validator_pure, expected_dumps", [(True, 1), (False, 2)])
+    def test_pure_validator_reuses_raw_serialization(
+        self, redis_stub, monkeypatch, validator_pure, expected_dumps
+    ):
+        from src.postprocessing import redis_barrier
+
+        calls = []
+        real_dumps = redis_barrier._dumps
+        monkeypatch.setattr(redis_barrier, "_dumps", lambda payload: calls.append(1) or real_dumps(payload))
+
+        process_layer_with_barrier(
+            input_data={"x": 1},
+            layer_fn=_identity_layer,
+            validator_fn=_passing_validator,
+            redis_client=redis_stub,
+            run_id="run-id-003",
+            message_id="test@example.it",
+            layer_name="postprocessing",
+            validator_pure=validator_pure,
+        )
+        prefix = "run:run-id-003:msg:test@example.it:layer:postprocessing"
+        assert len(calls) == expected_dumps
+        assert redis_stub.get(f"{prefix}:normalized") == redis_stub.get(f"{prefix}:raw")
+
+
+class TestBackgroundWrites:
+    def test_success_persisted_after_flush(self):
+        client = _PipelinedRedis()
+        for i in range(3):
+            process_layer_with_barrier(
+                input_data={"x": i},
+                layer_fn=_identity_layer,
+                validator_fn=_passing_validator,
+                redis_client=client,
+                run_id=f"run-bg-00{i}",
+                message_id="test@example.it",
+                layer_name="postprocessing",
+                background=True,
+            )
+        flush_barrier_writes()
+        assert len(client.keys_matching("run:run-bg-")) == 6
+        assert 1 <= client.round_trips <= 3
+        assert get_normalized_payload(client, "run-bg-002", "test@example.it", "postprocessing")["x"] == 2
+
+    def test_failure_persisted_synchronously(self, redis_stub):
+        with pytest.raises(WriteBarrierValidationError):
+            process_layer_with_barrier(
+                input_data={"x": 1},
+                layer_fn=_identity_layer,
+                validator_fn=_failing_validator,
+                redis_client=redis_stub,
+                run_id="run-bg-fail",
+                message_id="test@example.it",
+                layer_name="postprocessing",
+                background=True,
+            )
+        # No flush: error and raw are written before the exception propagates
+        assert redis_stub.get("run:run-bg-fail:msg:test@example.it:layer:postprocessing:error")
+        assert redis_stub.get("run:run-bg-fail:msg:test@example.it:layer:postprocessing:raw")
+
+
+class TestHashLayout:
+    def _run(self, client, run_id: str, validator=_passing_validator) -> None:
+        process_layer_with_barrier(
+            input_data={"x": 1},
+            layer_fn=_identity_layer,
+            validator_fn=validator,
+            redis_client=client,
+            run_id=run_id,
+            message_id="<test@example.it>",
+            layer_name="postprocessing",
+            ttl=600,
+            hash_layout=True,
+        )
+
+    def test_single_hash_single_expiry(self):
+        client = _PipelinedRedis()
+        self._run(client, "run-hash-001")
+        assert client.keys_matching("run:run-hash-001:") == ["run:run-hash-001:msg:test@example.it"]
+        assert client.expiries == {"run:run-hash-001:msg:test@example.it": 600}
+        assert client.round_trips == 1
+
+    def test_getters_read_hash_fields(self, redis_stub):
+        self._run(redis_stub, "run-hash-002")
+        args = (redis_stub, "run-hash-002", "<test@example.it>", "postprocessing")
+        assert get_raw_payload(*args, hash_layout=True)["x"] == 1
+        assert get_normalized_payload(*args, hash_layout=True)["x"] == 1
+        assert get_raw_payload(*args) is None  # key layout untouched
+
+        payloads = get_all_layer_payloads(
+            redis_stub, "run-hash-002", "<test@example.it>", ["postprocessing", "other"],
+            hash_layout=True,
+        )
+        assert payloads["postprocessing"]["raw"]["x"] == 1
+        assert payloads["other"] == {"raw": None, "normalized": None}
+
+    def test_failure_writes_error_field(self, redis_stub):
+        with pytest.raises(WriteBarrierValidationError):
+            self._run(redis_stub, "run-hash-003", validator=_failing_validator)
+        fields = redis_stub._store["run:run-hash-003:msg:test@example.it"]
+        assert sorted(fields) == ["postprocessing:error", "postprocessing:raw"]
+
+
+class _AsyncPipelinedRedis:
+    """Async facade over _PipelinedRedis, shaped like redis.asyncio.Redis."""
+
+    def __init__(self):
+        self.sync = _PipelinedRedis()
+
+    def pipeline(self, transaction: bool = True):  # noqa: ARG002
+        return _AsyncStubPipeline(self.sync)
+
+
+class _AsyncStubPipeline(_StubPipeline):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self._queued.clear()
+
+    async def execute(self) -> list:
+        return super().execute()
+
+
+class TestAsyncBarrier:
+    def _run(self, client, run_id: str, validator=_passing_validator) -> dict:
+        return asyncio.run(
+            aprocess_layer_with_barrier(
+                input_data={"x": 1},
+                layer_fn=_identity_layer,
+                validator_fn=validator,
+                redis_client=client,
+                run_id=run_id,
+                message_id="test@example.it",
+                layer_name="postprocessing",
+            )
+        )
+
+    def test_success_single_round_trip(self):
+        client = _AsyncPipelinedRedis()
+        result = self._run(client, "run-async-001")
+        assert result["processed"] is True
+        assert client.sync.round_trips == 1
+        assert get_normalized_payload(
+            client.sync, "run-async-001", "test@example.it", "postprocessing"
+        ) == result
+
+    def test_failure_persists_raw_and_error(self):
+        client = _AsyncPipelinedRedis()
+        with pytest.raises(WriteBarrierValidationError):
+            self._run(client, "run-async-002", validator=_failing_validator)
+        assert sorted(
+            k.rsplit(":", 1)[1] for k in client.sync.keys_matching("run:run-async-002:")
+        ) == ["error", "raw"]
+
+    def test_build_async_redis_client_uses_pool(self):
+        client = build_async_redis_client("redis://localhost:6379/0", max_connections=4)
+        assert client.connection_pool.max_connections == 4
+
+
+class TestUndecodedGetters:
+    def test_decode_false_returns_stored_json(self, redis_stub):
+        process_layer_with_barrier(
+            input_data={"x": 1},
+            layer_fn=_identity_layer,
+            validator_fn=_passing_validator,
+            redis_client=redis_stub,
+            run_id="run-nodecode-001",
+            message_id="test@example.it",
+            layer_name="postprocessing",
+        )
+        args = (redis_stub, "run-nodecode-001", "test@example.it", "postprocessing")
+        raw = get_raw_payload(*args, decode=False)
+        assert raw == redis_stub.get("run:run-nodecode-001:msg:test@example.it:layer:postprocessing:raw")
+        assert json.loads(raw) == get_raw_payload(*args)
+        assert json.loads(get_normalized_payload(*args, decode=False)) == get_normalized_payload(*args)
+        assert get_raw_payload(redis_stub, "missing", "test@example.it", "postprocessing",
+                               decode=False) is None
+
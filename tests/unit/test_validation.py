@@ -30,6 +30,41 @@ class TestValidateLLMOutputMultistage:
         assert len(result.errors) == 0
         assert result.data is not None
 
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda d: d.pop("sentiment"),
+            lambda d: d["topics"][0].update(confidence=1.7),
+            lambda d: d["topics"][0].update(unexpected="x"),
+        ],
+    )
+    def test_schema_error_message_matches_jsonschema(
+        self, mutate, mock_llm_output, mock_candidates, mock_document
+    ):
+        import jsonschema
+
+        from src.config.schemas import LLM_RESPONSE_SCHEMA
+
+        data = json.loads(json.dumps(mock_llm_output))
+        mutate(data)
+        with pytest.raises(jsonschema.ValidationError) as exc_info:
+            jsonschema.validate(instance=data, schema=LLM_RESPONSE_SCHEMA["schema"])
+
+        result = validate_llm_output_multistage(data, mock_candidates, mock_document.body_canonical)
+
+        assert result.valid is False
+        assert result.errors == [f"Schema violation: {exc_info.value.message}"]
+
+    def test_custom_allowed_topics_list(self, mock_llm_output_json, mock_candidates, mock_document):
+        result = validate_llm_output_multistage(
+            mock_llm_output_json,
+            mock_candidates,
+            mock_document.body_canonical,
+            allowed_topics=["RECLAMO"],
+        )
+        assert result.valid is False
+        assert any(e.startswith("Invalid labelid:") for e in result.errors)
+
     def test_invalid_json_fails(self, mock_candidates, mock_document):
         result = validate_llm_output_multistage(
             "not valid json {{{",
@@ -210,6 +245,44 @@ class TestEvidenceVerification:
         warnings = verify_evidence_quotes(topics, text)
         assert any("Span mismatch" in w for w in warnings)
 
+    def test_many_quotes_single_pass(self):
+        words = [f"parola{i}" for i in range(12)]
+        text = " ".join(words)
+        quotes = words + ["parola3 parola4", "assente", "parola1"]
+        topics = [{"evidence": [{"quote": q} for q in quotes]}]
+
+        warnings = verify_evidence_quotes(topics, text)
+
+        assert warnings == ["Evidence quote not found in text: 'assente...'"]
+
+    def test_span_verified_quotes_not_searched(self, monkeypatch):
+        import src.postprocessing.validation as validation_module
+
+        searched: list = []
+        real_find_quotes = validation_module._find_quotes
+
+        def recording_find_quotes(quotes, text_canonical):
+            searched.extend(quotes)
+            return real_find_quotes(quotes, text_canonical)
+
+        monkeypatch.setattr(validation_module, "_find_quotes", recording_find_quotes)
+        text = "Vorrei confermare i dati del contratto."
+        topics = [
+            {
+                "evidence": [
+                    {"quote": "confermare i dati", "span": [7, 24]},
+                    {"quote": "del contratto", "span": [0, 5]},  # wrong span: searched
+                    {"quote": "assente"},
+                ],
+            },
+        ]
+
+        warnings = verify_evidence_quotes(topics, text)
+
+        assert sorted(searched) == ["assente", "del contratto"]
+        assert warnings[0] == "Span mismatch: span=[0,5] extracts 'Vorre...' but quote is 'del contratto...'"
+        assert warnings[1] == "Evidence quote not found in text: 'assente...'"
+
 
 class TestEvidencePolicy:
     """Tests for evidence policy enforcement."""
@@ -231,6 +304,88 @@ class TestEvidencePolicy:
     def test_empty_evidence_passes(self):
         assert enforce_evidence_policy([], "any text", threshold=0.3) is True
 
+    def test_stops_verifying_once_threshold_exceeded(self):
+        text = "Testo completamente diverso."
+        topics = [{"evidence": [{"quote": f"frase inventata {i}"}]} for i in range(10)]
+
+        assert len(verify_evidence_quotes(topics, text, max_failures=3)) == 4
+        assert enforce_evidence_policy(topics, text, threshold=0.3) is False
+
+    def test_boundary_failure_rate_passes(self):
+        text = "uno due tre quattro cinque sei sette otto nove dieci"
+        words = text.split()
+        topics = [{"evidence": [{"quote": w if i >= 3 else f"assente {i}"}]} for i, w in enumerate(words)]
+        # 3/10 failures == threshold: not above it
+        assert enforce_evidence_policy(topics, text, threshold=0.3) is True
+
+    def test_boundary_plus_one_failure_fails(self):
+        text = "uno due tre quattro cinque sei sette otto nove dieci"
+        words = text.split()
+        topics = [{"evidence": [{"quote": w if i >= 4 else f"assente {i}"}]} for i, w in enumerate(words)]
+        # 4/10 failures > threshold
+        assert enforce_evidence_policy(topics, text, threshold=0.3) is False
+
+    def test_quote_scan_stops_with_verification(self, monkeypatch):
+        import src.postprocessing.validation as validation_module
+
+        searched: list = []
+        real_find_quotes = validation_module._find_quotes
+
+        def recording_find_quotes(quotes, text_canonical):
+            searched.extend(quotes)
+            return real_find_quotes(quotes, text_canonical)
+
+        monkeypatch.setattr(validation_module, "_find_quotes", recording_find_quotes)
+        text = "Testo completamente diverso."
+        topics = [{"evidence": [{"quote": f"frase inventata {i}"}]} for i in range(10)]
+
+        assert enforce_evidence_policy(topics, text, threshold=0.3) is False
+        # threshold 0.3 * 10 → scan stops one past floor + 1 = 4 warnings
+        assert sorted(searched) == [f"frase inventata {i}" for i in range(5)]
+
+    @pytest.mark.parametrize("threshold, total, count", [(0.7, 90, 63), (0.29, 100, 29)])
+    def test_rate_equal_to_threshold_passes(self, threshold, total, count):
+        topics = [{"evidence": [{"quote": "q"}] * total}]
+        assert enforce_evidence_policy(topics, "", threshold=threshold, warnings=["w"] * count) is True
+
+    def test_precomputed_warnings_parity_with_ratio(self):
+        for i in range(101):
+            threshold = i / 100
+            for total in range(1, 61):
+                topics = [{"evidence": [{"quote": "q"}] * total}]
+                for count in range(total + 1):
+                    expected = not count / total > threshold
+                    got = enforce_evidence_policy(topics, "", threshold=threshold, warnings=["w"] * count)
+                    assert got is expected, (threshold, total, count)
+
+    def test_early_stop_parity_with_ratio(self):
+        for i in range(21):
+            threshold = i / 20
+            for total in range(1, 21):
+                for count in range(total + 1):
+                    topics = [{"evidence": [{"quote": "assente" if k < count else "x"}]} for k in range(total)]
+                    expected = not count / total > threshold
+                    assert enforce_evidence_policy(topics, "x", threshold=threshold) is expected, (
+                        threshold, total, count,
+                    )
+
+    def test_precomputed_warnings_are_used(self):
+        text = "Ho un contratto da verificare."
+        topics = [{"evidence": [{"quote": "contratto da verificare"}]}]
+        assert enforce_evidence_policy(topics, text, warnings=["unverified"]) is False
+
+    def test_validation_evidence_warnings_match_recompute(
+        self, mock_llm_output, mock_candidates, mock_document
+    ):
+        data = json.loads(json.dumps(mock_llm_output))
+        bad_topic = dict(data["topics"][0], evidence=[{"quote": "frase inventata"}])
+        data["topics"].append(bad_topic)  # duplicate labelid: dropped by dedup
+        result = validate_llm_output_multistage(data, mock_candidates, mock_document.body_canonical)
+
+        assert result.evidence_warnings == verify_evidence_quotes(
+            result.data["topics"], mock_document.body_canonical
+        )
+
 
 # ===========================================================================
 # Fix 1 regression — LLM echo fields must NOT generate warnings
@@ -312,6 +467,14 @@ class TestComputeSpanFromQuote:
         assert status == "exact_match"
         assert span == [0, len(quote)]
 
+    def test_exact_match_offsets_are_characters(self):
+        body = "Perché è così: la fattura è errata."
+        quote = "la fattura è errata"
+        span, status = compute_span_from_quote(quote, body)
+        assert status == "exact_match"
+        assert span == [body.index(quote), body.index(quote) + len(quote)]
+        assert body[span[0]:span[1]] == quote
+
     def test_fuzzy_match_double_space(self):
         body = "verifica  il  documento allegato"
         quote = "verifica il documento allegato"
@@ -319,6 +482,36 @@ class TestComputeSpanFromQuote:
         assert status in ("exact_match", "fuzzy_match")
         assert span is not None
 
+    @pytest.mark.parametrize("use_rapidfuzz", [True, False])
+    def test_fuzzy_match_span_covers_quote(self, monkeypatch, use_rapidfuzz):
+        import src.postprocessing.validation as validation_module
+
+        if use_rapidfuzz and not validation_module.RAPIDFUZZ_AVAILABLE:
+            pytest.skip("rapidfuzz not installed")
+        monkeypatch.setattr(validation_module, "RAPIDFUZZ_AVAILABLE", use_rapidfuzz)
+        body = "Buongiorno, vorrei confermare i dati del contrato. Grazie."
+        quote = "confermare i dati del contratto"
+        span, status = compute_span_from_quote(quote, body)
+        assert status == "fuzzy_match"
+        assert body[span[0]:span[1]].startswith("confermare")
+
+    def test_disjoint_characters_skip_fuzzy_scan(self, monkeypatch):
+        import src.postprocessing.validation as validation_module
+
+        def fail(*args, **kwargs):
+            raise AssertionError("fuzzy scan should have been skipped")
+
+        monkeypatch.setattr(validation_module, "partial_ratio_alignment", fail, raising=False)
+        monkeypatch.setattr("difflib.SequenceMatcher", fail)
+        body = "Buongiorno, vorrei confermare i dati del contratto. Grazie."
+        span, status = compute_span_from_quote("XYZ WQK 987 ###", body)
+        assert (span, status) == (None, "not_found")
+
+    def test_quote_longer_than_body_not_found(self):
+        span, status = compute_span_from_quote("una quote molto più lunga del testo", "quote")
+        assert status == "not_found"
+        assert span is None
+
     def test_not_found(self):
         body = "Testo completamente diverso senza corrispondenza."
         quote = "questa frase non esiste nel testo"